@@ -10,6 +10,7 @@ Usage:
     python run_fast_tests.py
     python run_fast_tests.py --verbose
     python run_fast_tests.py --parallel
+    python run_fast_tests.py --category integration
 """
 
 import subprocess
@@ -70,11 +71,16 @@ def run_fast_tests(verbose=False, parallel=True):
         return False
 
 
-def run_specific_test_category(category, verbose=False):
+def run_specific_test_category(category, verbose=False, parallel=True):
     """Run tests for a specific category."""
 
     cmd = ["python", "-m", "pytest", "-m", category, "--tb=short"]
 
+    # Each worker gets its own database file (see tests/conftest.py), so the
+    # sleep-bound integration tests can be spread across workers too
+    if parallel:
+        cmd.extend(["-n", "auto"])
+
     if verbose:
         cmd.append("-v")
 
@@ -100,7 +106,7 @@ if __name__ == "__main__":
         args.parallel = False
 
     if args.category:
-        success = run_specific_test_category(args.category, args.verbose)
+        success = run_specific_test_category(args.category, args.verbose, args.parallel)
     else:
         success = run_fast_tests(args.verbose, args.parallel)
 
@@ -345,23 +345,31 @@ class InterfaceAnalyzer:
 
         return enhanced
 
-    def _monitor_traffic_patterns(self, interface_names: List[str], duration: int) -> Dict[str, List[Dict[str, Any]]]:
+    def _monitor_traffic_patterns(self, interface_names: List[str], duration: Optional[int] = None,
+                                  sample_count: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Monitor traffic patterns for multiple interfaces over time.
 
         Args:
             interface_names: List of interface names to monitor
             duration: Monitoring duration in seconds
+            sample_count: Number of samples to take instead of monitoring for
+                a duration; samples are taken one sample interval apart
 
         Returns:
             Dict[str, List[Dict[str, Any]]]: Traffic data for each interface
+
+        Raises:
+            ValueError: If neither duration nor sample_count is given
         """
-        logger.debug(f"Monitoring traffic for {len(interface_names)} interfaces over {duration}s")
+        if sample_count is None and duration is None:
+            raise ValueError("Either duration or sample_count is required")
+        # Only used without a sample count, where the check above ensures a duration
+        monitor_duration: int = duration or 0
 
         traffic_data = {name: [] for name in interface_names}
-        start_time = time.time()
 
-        while time.time() - start_time < duration:
+        def take_sample() -> None:
             for interface_name in interface_names:
                 try:
                     stats = self.network_module.get_interface_stats(interface_name)
@@ -375,7 +383,20 @@ class InterfaceAnalyzer:
                 except Exception as e:
                     logger.debug(f"Failed to get stats for {interface_name} during monitoring: {e}")
 
-            time.sleep(self._sample_interval)
+        if sample_count is not None:
+            logger.debug(f"Monitoring traffic for {len(interface_names)} interfaces over {sample_count} samples")
+
+            for sample in range(sample_count):
+                if sample:
+                    time.sleep(self._sample_interval)
+                take_sample()
+        else:
+            logger.debug(f"Monitoring traffic for {len(interface_names)} interfaces over {monitor_duration}s")
+            start_time = time.time()
+
+            while time.time() - start_time < monitor_duration:
+                take_sample()
+                time.sleep(self._sample_interval)
 
         logger.debug(f"Collected traffic data: { {k: len(v) for k, v in traffic_data.items()} } samples")
         return traffic_data
@@ -12,12 +12,14 @@ This module provides continuous network traffic data collection with:
 """
 
 import logging
+import queue
+import random
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
+from typing import Callable, ClassVar, Collection, Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
-from contextlib import contextmanager
+from operator import attrgetter, itemgetter
 
 try:
     from apscheduler.schedulers.background import BackgroundScheduler
@@ -30,17 +32,33 @@ except ImportError:
     logging.warning("APScheduler not available. Install with: pip install apscheduler")
 
 from .database import (
-    insert_traffic_data, get_configuration_value, set_configuration_value,
-    DatabaseError
+    insert_traffic_data, insert_traffic_data_batch, get_configuration_value,
+    get_configuration_values_batch, set_configuration_value, DatabaseError
 )
 from .network import (
-    get_all_interface_stats, get_interface_stats, validate_interface,
+    get_all_interface_stats, validate_interfaces,
     NetworkError, InterfaceNotFoundError
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Traffic counters tracked for every interface, in delta calculation order
+COUNTER_FIELDS = ('rx_bytes', 'tx_bytes', 'rx_packets', 'tx_packets')
+_get_current_counters = itemgetter(*COUNTER_FIELDS)
+_get_previous_counters = attrgetter(*COUNTER_FIELDS)
+
+# Interface counters are 64-bit unsigned and wrap around to zero
+COUNTER_MASK = 2**64 - 1
+
+# Background writer limits: collection cycles waiting to be written and rows
+# per database batch
+WRITE_QUEUE_SIZE = 1000
+WRITE_BATCH_SIZE = 100
+
+# Queued by stop_collection to tell the background writer to exit
+_WRITER_STOP = object()
+
 
 @dataclass
 class CollectionStats:
@@ -54,16 +72,49 @@ class CollectionStats:
     total_errors: int = 0
     consecutive_failures: int = 0
     start_time: Optional[datetime] = None
+    dropped_writes: int = 0
 
 
-@dataclass
 class InterfaceData:
-    """Stores previous collection data for delta calculation."""
-    rx_bytes: int = 0
-    tx_bytes: int = 0
-    rx_packets: int = 0
-    tx_packets: int = 0
-    timestamp: Optional[datetime] = None
+    """
+    Stores previous collection data for delta calculation.
+
+    One instance is kept per monitored interface, so the class uses
+    __slots__ instead of a per-instance __dict__. It is written out by hand
+    because dataclass(slots=True) requires Python 3.10.
+    """
+
+    __slots__ = ('rx_bytes', 'tx_bytes', 'rx_packets', 'tx_packets', 'timestamp')
+
+    def __init__(self,
+                 rx_bytes: int = 0,
+                 tx_bytes: int = 0,
+                 rx_packets: int = 0,
+                 tx_packets: int = 0,
+                 timestamp: Optional[datetime] = None):
+        self.rx_bytes = rx_bytes
+        self.tx_bytes = tx_bytes
+        self.rx_packets = rx_packets
+        self.tx_packets = tx_packets
+        self.timestamp = timestamp
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.rx_bytes, self.tx_bytes, self.rx_packets, self.tx_packets, self.timestamp) ==
+            (other.rx_bytes, other.tx_bytes, other.rx_packets, other.tx_packets, other.timestamp)
+        )
+
+    # Mutable like the dataclass it replaces, so instances are not hashable
+    __hash__: ClassVar[None] = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"InterfaceData(rx_bytes={self.rx_bytes!r}, tx_bytes={self.tx_bytes!r}, "
+            f"rx_packets={self.rx_packets!r}, tx_packets={self.tx_packets!r}, "
+            f"timestamp={self.timestamp!r})"
+        )
 
 
 class CollectorError(Exception):
@@ -97,14 +148,18 @@ class NetworkDataCollector:
     def __init__(self,
                  polling_interval: int = 60,
                  max_retries: int = 5,
-                 retry_delay: float = 2.0):
+                 retry_delay: float = 2.0,
+                 max_retry_delay: float = 30.0,
+                 retry_jitter: float = 0.5):
         """
         Initialize the NetworkDataCollector.
 
         Args:
             polling_interval: Collection interval in seconds (default: 30)
             max_retries: Maximum retry attempts for failed operations
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds, doubled after each attempt
+            max_retry_delay: Upper bound for the delay between retries in seconds
+            retry_jitter: Maximum random fraction added to each retry delay
         """
         if not APSCHEDULER_AVAILABLE:
             raise CollectorError(
@@ -115,17 +170,35 @@ class NetworkDataCollector:
         self.polling_interval = polling_interval
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.retry_jitter = retry_jitter
 
         # Collection state
         self._is_running = False
         self._scheduler = None
         self._stop_event = threading.Event()
+        self._last_cycle_duration = 0.0
+
+        # Set each time a collection cycle is recorded, so callers can wait
+        # for the next poll instead of sleeping for a fixed time
+        self._poll_completed_event = threading.Event()
 
         # Data storage
         self._previous_data: Dict[str, InterfaceData] = {}
         self._stats = CollectionStats()
         self._lock = threading.Lock()
 
+        # Collection cycles are serialized so the scheduler and manual
+        # collect_once calls can share the pending row buffers below
+        self._collection_lock = threading.Lock()
+        self._pending_names: List[str] = []
+        self._pending_rows: List[Dict[str, Any]] = []
+        self._pending_stats: List[Dict[str, Any]] = []
+
+        # Background database writer, active only while scheduled collection runs
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+
         # Configuration keys
         self._config_keys = {
             'monitored_interfaces': 'collector.monitored_interfaces',
@@ -166,6 +239,7 @@ class NetworkDataCollector:
 
                 # Start scheduler
                 self._scheduler.start()
+                self._start_writer()
                 self._is_running = True
                 self._stats.start_time = datetime.now()
                 self._stop_event.clear()
@@ -184,19 +258,33 @@ class NetworkDataCollector:
             if not self._is_running:
                 logger.warning("Collector is not running")
                 return
+            scheduler = self._scheduler
 
-            try:
-                self._stop_event.set()
+        # Wait for a running job outside the lock: the job needs the lock to
+        # record its cycle, so holding it here would never let the job finish
+        self._stop_event.set()
+        try:
+            if scheduler:
+                scheduler.shutdown(wait=True)
+            logger.info("Stopped network data collection")
+        except Exception as e:
+            logger.error(f"Error stopping collection: {e}")
 
-                if self._scheduler:
-                    self._scheduler.shutdown(wait=True)
+        with self._lock:
+            self._is_running = False
 
-                self._is_running = False
-                logger.info("Stopped network data collection")
+        # Flush queued rows once no more collection cycles can run
+        self._stop_writer()
 
-            except Exception as e:
-                logger.error(f"Error stopping collection: {e}")
-                self._is_running = False
+    def can_start(self) -> bool:
+        """
+        Check whether start_collection() can be called now.
+
+        Returns:
+            bool: True if the collector is stopped and its writer thread has exited
+        """
+        with self._lock:
+            return not self._is_running and self._writer_thread is None
 
     def collect_once(self) -> Dict[str, Any]:
         """
@@ -211,7 +299,8 @@ class NetworkDataCollector:
         try:
             logger.debug("collect_once called")
             result = self._perform_collection()
-            logger.debug(f"collect_once got result: {result}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"collect_once got result: {result}")
             collected_count = len(result.get('data', {}))
             logger.debug(f"collect_once calculated interfaces_collected: {collected_count}")
             return {
@@ -233,6 +322,10 @@ class NetworkDataCollector:
         Returns:
             Dict[str, Any]: Current status and statistics
         """
+        # Read the configuration before taking the lock, so status probes
+        # don't hold up collection cycles while the database is queried
+        configuration = self._get_current_config()
+
         with self._lock:
             status = {
                 'is_running': self._is_running,
@@ -245,9 +338,10 @@ class NetworkDataCollector:
                     'last_successful_poll': self._stats.last_successful_poll.isoformat() if self._stats.last_successful_poll else None,
                     'total_errors': self._stats.total_errors,
                     'consecutive_failures': self._stats.consecutive_failures,
+                    'dropped_writes': self._stats.dropped_writes,
                     'uptime_seconds': (datetime.now() - self._stats.start_time).total_seconds() if self._stats.start_time else 0
                 },
-                'configuration': self._get_current_config(),
+                'configuration': configuration,
                 'previous_data_count': len(self._previous_data)
             }
 
@@ -270,6 +364,7 @@ class NetworkDataCollector:
                 'last_successful_poll': self._stats.last_successful_poll.isoformat() if self._stats.last_successful_poll else None,
                 'total_errors': self._stats.total_errors,
                 'consecutive_failures': self._stats.consecutive_failures,
+                'dropped_writes': self._stats.dropped_writes,
                 'uptime_seconds': (datetime.now() - self._stats.start_time).total_seconds() if self._stats.start_time else 0
             }
 
@@ -277,25 +372,41 @@ class NetworkDataCollector:
         """
         Background job for data collection.
         This method is called by the scheduler.
+
+        The interval trigger fires relative to the previous scheduled start,
+        not to the end of the previous job, so a slow cycle does not push
+        later polls back. A cycle that takes longer than the polling interval
+        makes the scheduler skip the run that fell inside it, so instead of
+        waiting for the next tick the job starts the next cycle straight away
+        while cycles keep succeeding and collection is not being stopped.
         """
-        try:
-            result = self._perform_collection()
+        while True:
+            start = time.monotonic()
+            succeeded = self._run_scheduled_cycle()
+            self._last_cycle_duration = time.monotonic() - start
 
-            # Update statistics
-            with self._lock:
-                self._stats.total_polls += 1
-                self._stats.last_poll_time = datetime.now()
+            if self._last_cycle_duration < self.polling_interval:
+                return
 
-                if result['success']:
-                    self._stats.successful_polls += 1
-                    self._stats.consecutive_failures = 0
-                    self._stats.last_successful_poll = datetime.now()
-                else:
-                    self._stats.failed_polls += 1
-                    self._stats.consecutive_failures += 1
-                    self._stats.total_errors += len(result.get('errors', []))
+            logger.warning(
+                f"Collection cycle took {self._last_cycle_duration:.2f}s, "
+                f"longer than the {self.polling_interval}s polling interval"
+            )
+            if not succeeded or self._stop_event.is_set():
+                return
+            logger.debug("Polling interval already elapsed, starting next collection cycle now")
+
+    def _run_scheduled_cycle(self) -> bool:
+        """
+        Run one collection cycle for the background job and log its outcome.
 
-                self._stats.interfaces_monitored = len(self._previous_data)
+        Returns:
+            bool: True if the cycle completed without errors
+        """
+        try:
+            # Statistics are recorded by the collection cycle itself, or by the
+            # background writer once the cycle's rows are stored
+            result = self._perform_collection(background_write=True)
 
             # Log collection results
             if result['success']:
@@ -303,18 +414,37 @@ class NetworkDataCollector:
             else:
                 logger.warning(f"Collection cycle had errors: {result['errors']}")
 
+            return result['success']
+
         except Exception as e:
             logger.error(f"Collection job failed: {e}")
-            with self._lock:
-                self._stats.total_polls += 1
-                self._stats.failed_polls += 1
-                self._stats.consecutive_failures += 1
-                self._stats.total_errors += 1
+            self._record_poll(1)
+            return False
 
-    def _perform_collection(self) -> Dict[str, Any]:
+    def _perform_collection(self, background_write: bool = False) -> Dict[str, Any]:
         """
         Perform the actual data collection.
 
+        Args:
+            background_write: Hand the rows to the background writer, when it
+                is running, instead of storing them before returning
+
+        Returns:
+            Dict[str, Any]: Collection results with data and any errors
+        """
+        with self._collection_lock:
+            return self._run_collection_cycle(background_write)
+
+    def _run_collection_cycle(self, background_write: bool = False) -> Dict[str, Any]:
+        """
+        Run one collection cycle. Must be called with the collection lock held.
+
+        Args:
+            background_write: Hand the rows to the background writer, when it
+                is running, instead of storing them before returning. The
+                writer then records the cycle in the statistics once the rows
+                are stored, so a failing database shows up as failed polls.
+
         Returns:
             Dict[str, Any]: Collection results with data and any errors
         """
@@ -322,73 +452,114 @@ class NetworkDataCollector:
         collected_data = {}
 
         try:
+            # Read counters for all interfaces in one pass; per-interface lookups
+            # below are served from this snapshot instead of re-reading stats
+            try:
+                all_stats = get_all_interface_stats()
+            except NetworkError as e:
+                errors.append(f"Failed to get all interface stats: {e}")
+                logger.error(f"Failed to get all interface stats: {e}")
+                self._record_poll(len(errors))
+                return {'success': False, 'data': {}, 'errors': errors}
+
+            # Every interface in the snapshot shares one sample time, so the clock is
+            # read and the ISO timestamp formatted once per cycle, not per interface
+            cycle_time = datetime.now()
+            cycle_timestamp = cycle_time.isoformat()
+
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
             # Get monitored interfaces from configuration
-            monitored_interfaces = self._get_monitored_interfaces()
+            monitored_interfaces: Collection[str] = self._get_monitored_interfaces()
             logger.debug(f"Monitored interfaces: {monitored_interfaces}")
 
             if not monitored_interfaces:
-                # If no specific interfaces configured, monitor all available interfaces
-                try:
-                    all_stats = get_all_interface_stats()
-                    monitored_interfaces = list(all_stats.keys())
-                    logger.debug(f"No configured interfaces, using all available: {monitored_interfaces}")
-                except NetworkError as e:
-                    errors.append(f"Failed to get all interface stats: {e}")
-                    logger.error(f"Failed to get all interface stats: {e}")
-                    return {'success': False, 'data': {}, 'errors': errors}
-
-            # Collect data for each monitored interface
+                # If no specific interfaces configured, monitor all available interfaces.
+                # Walk the snapshot in its own order rather than a sorted copy: it is the
+                # order the entries were first added to _previous_data, so the lookups
+                # below visit that dict's entries sequentially.
+                monitored_interfaces = all_stats.keys()
+                if debug_enabled:
+                    logger.debug(f"No configured interfaces, using all available: {list(monitored_interfaces)}")
+
+            # Collect data for each monitored interface; rows are written in a single batch.
+            # Pending rows are kept in parallel lists indexed by position so the row dicts
+            # double as the database batch and the result data without repacking them.
+            # The lists are reused across cycles and never leave this method
+            pending_names = self._pending_names
+            pending_rows = self._pending_rows
+            pending_stats = self._pending_stats
+            pending_names.clear()
+            pending_rows.clear()
+            pending_stats.clear()
+
+            # Bind per-interface lookups once and skip building debug messages
+            # (which format whole stats dicts) unless debug logging is enabled
+            get_stats = all_stats.get
+            get_previous = self._previous_data.get
+            calculate_deltas = self._calculate_deltas
+            append_name = pending_names.append
+            append_row = pending_rows.append
+            append_stats = pending_stats.append
+
+            # Interfaces whose counters have not moved since the last stored sample
+            idle_data = {}
+
             logger.debug(f"Starting collection for {len(monitored_interfaces)} interfaces")
             for interface_name in monitored_interfaces:
                 try:
                     # Get current interface stats
-                    current_stats = get_interface_stats(interface_name)
-                    logger.debug(f"Got stats for {interface_name}: {current_stats}")
-
-                    # Calculate deltas and handle counter rollover
-                    delta_data = self._calculate_deltas(interface_name, current_stats)
-                    logger.debug(f"Delta calculation for {interface_name}: {delta_data}")
-
-                    if delta_data:
-                        # Store in database
-                        try:
-                            self._store_traffic_data(delta_data)
-                        except DatabaseError as e:
-                            errors.append(f"Failed to store data for {interface_name}: {e}")
-                            logger.error(f"Failed to store data for {interface_name}: {e}")
+                    current_stats = get_stats(interface_name)
+                    if current_stats is None:
+                        raise InterfaceNotFoundError(
+                            f"Interface '{interface_name}' not found in network statistics"
+                        )
+                    if debug_enabled:
+                        logger.debug(f"Got stats for {interface_name}: {current_stats}")
+
+                    prev_data = get_previous(interface_name)
+                    if prev_data is None:
+                        # First sample for this interface: there is nothing to diff against,
+                        # so go straight to the baseline row. _previous_data is filled in
+                        # once the row has been handed off for storage.
+                        delta_data = None
+                    else:
+                        # Idle interface: report a zero delta but skip the delta calculation,
+                        # the database write and the previous data update. The next stored
+                        # delta then covers the whole idle period.
+                        if (prev_data.timestamp is not None and
+                                _get_previous_counters(prev_data) == _get_current_counters(current_stats)):
+                            idle_data[interface_name] = {
+                                'interface_name': interface_name,
+                                'timestamp': cycle_timestamp,
+                                'rx_bytes': 0,
+                                'tx_bytes': 0,
+                                'rx_packets': 0,
+                                'tx_packets': 0,
+                                'collection_interval_seconds': (cycle_time - prev_data.timestamp).total_seconds()
+                            }
                             continue
-                        logger.debug(f"Stored data for {interface_name}")
 
-                        # Update previous data for next delta calculation
-                        self._update_previous_data(interface_name, current_stats)
+                        # Calculate deltas and handle counter rollover
+                        delta_data = calculate_deltas(interface_name, current_stats, cycle_time, cycle_timestamp)
+                        if debug_enabled:
+                            logger.debug(f"Delta calculation for {interface_name}: {delta_data}")
 
-                        collected_data[interface_name] = delta_data
-                        logger.debug(f"Added {interface_name} to collected data")
-                    else:
+                    if delta_data is None:
                         # First collection - return current stats as baseline data
-                        baseline_data = {
+                        delta_data = {
                             'interface_name': interface_name,
-                            'timestamp': datetime.now().isoformat(),
+                            'timestamp': cycle_timestamp,
                             'rx_bytes': current_stats['rx_bytes'],
                             'tx_bytes': current_stats['tx_bytes'],
                             'rx_packets': current_stats['rx_packets'],
                             'tx_packets': current_stats['tx_packets'],
                             'collection_interval_seconds': 0.0
                         }
-                        # Store baseline in database
-                        try:
-                            self._store_traffic_data(baseline_data)
-                        except DatabaseError as e:
-                            errors.append(f"Failed to store baseline data for {interface_name}: {e}")
-                            logger.error(f"Failed to store baseline data for {interface_name}: {e}")
-                            continue
-                        logger.debug(f"Stored baseline data for {interface_name}")
 
-                        # Update previous data for next delta calculation
-                        self._update_previous_data(interface_name, current_stats)
-
-                        collected_data[interface_name] = baseline_data
-                        logger.debug(f"Added baseline {interface_name} to collected data")
+                    append_name(interface_name)
+                    append_row(delta_data)
+                    append_stats(current_stats)
 
                 except (InterfaceNotFoundError, NetworkError) as e:
                     errors.append(f"Failed to collect data for {interface_name}: {e}")
@@ -397,58 +568,119 @@ class NetworkDataCollector:
                     errors.append(f"Unexpected error for {interface_name}: {e}")
                     logger.error(f"Unexpected error collecting data for {interface_name}: {e}")
 
-            logger.debug(f"Collection completed. Collected data: {collected_data}, Errors: {errors}")
+            write_queue = self._write_queue if background_write else None
+            queued = False
+            if pending_rows and write_queue is not None:
+                # Hand rows to the background writer so polling does not wait on the database.
+                # The pending lists are reused next cycle, so the writer gets a copy.
+                queued = self._enqueue_traffic_data(write_queue, cycle_time, list(pending_rows), len(errors))
+                if queued:
+                    for interface_name, current_stats in zip(pending_names, pending_stats):
+                        self._update_previous_data(interface_name, current_stats, cycle_time)
+                    collected_data = dict(zip(pending_names, pending_rows))
+                else:
+                    for interface_name in pending_names:
+                        errors.append(f"Failed to store data for {interface_name}: write queue full")
+            elif pending_rows:
+                try:
+                    self._store_traffic_data_batch(pending_rows)
+                except DatabaseError as e:
+                    for interface_name in pending_names:
+                        errors.append(f"Failed to store data for {interface_name}: {e}")
+                    logger.error(f"Failed to store data for {len(pending_rows)} interfaces: {e}")
+                else:
+                    logger.debug(f"Stored data for {len(pending_rows)} interfaces")
+                    for interface_name, current_stats in zip(pending_names, pending_stats):
+                        # Update previous data for next delta calculation
+                        self._update_previous_data(interface_name, current_stats, cycle_time)
+                    collected_data = dict(zip(pending_names, pending_rows))
 
-            # Update statistics (same as _collection_job)
-            with self._lock:
-                self._stats.total_polls += 1
-                self._stats.last_poll_time = datetime.now()
+            if idle_data:
+                collected_data.update(idle_data)
 
-                if len(errors) == 0:
-                    self._stats.successful_polls += 1
-                    self._stats.consecutive_failures = 0
-                    self._stats.last_successful_poll = datetime.now()
-                else:
-                    self._stats.failed_polls += 1
-                    self._stats.consecutive_failures += 1
-                    self._stats.total_errors += len(errors)
+            if debug_enabled:
+                logger.debug(f"Collection completed. Collected data: {collected_data}, Errors: {errors}")
 
-                self._stats.interfaces_monitored = len(self._previous_data)
+            if not queued:
+                self._record_poll(len(errors))
 
             result = {
                 'success': len(errors) == 0,
                 'data': collected_data,
                 'errors': errors
             }
-            logger.debug(f"Returning result: {result}")
+            if debug_enabled:
+                logger.debug(f"Returning result: {result}")
             return result
 
         except Exception as e:
             logger.error(f"Collection cycle failed: {e}")
+            self._record_poll(1)
             return {
                 'success': False,
                 'data': {},
                 'errors': [f"Collection failed: {e}"]
             }
 
-    def _calculate_deltas(self, interface_name: str, current_stats: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _record_poll(self, error_count: int, poll_time: Optional[datetime] = None) -> None:
+        """
+        Record the outcome of one collection cycle in the statistics.
+
+        Every cycle, whether run by the scheduler or by collect_once, is
+        recorded exactly once through this method, by the background writer
+        for cycles whose rows it stores.
+
+        Args:
+            error_count: Number of errors reported by the cycle
+            poll_time: Time the cycle read the counters (default: now)
+        """
+        now = poll_time if poll_time is not None else datetime.now()
+        stats = self._stats
+        with self._lock:
+            stats.total_polls += 1
+            stats.last_poll_time = now
+
+            if error_count:
+                stats.failed_polls += 1
+                stats.consecutive_failures += 1
+                stats.total_errors += error_count
+            else:
+                stats.successful_polls += 1
+                stats.consecutive_failures = 0
+                stats.last_successful_poll = now
+
+            stats.interfaces_monitored = len(self._previous_data)
+
+        self._poll_completed_event.set()
+
+    def _calculate_deltas(self,
+                          interface_name: str,
+                          current_stats: Dict[str, Any],
+                          current_time: Optional[datetime] = None,
+                          timestamp: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Calculate traffic deltas between current and previous collection.
 
         Args:
             interface_name: Name of the interface
             current_stats: Current interface statistics
+            current_time: Time the statistics were read (default: now)
+            timestamp: ISO format of current_time, if already formatted
 
         Returns:
             Optional[Dict[str, Any]]: Delta data or None if calculation fails
         """
         try:
-            current_time = datetime.now()
-            logger.debug(f"Calculating deltas for {interface_name}, current_stats: {current_stats}")
+            if current_time is None:
+                current_time = datetime.now()
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug(f"Calculating deltas for {interface_name}, current_stats: {current_stats}")
 
             # Get previous data
             prev_data = self._previous_data.get(interface_name)
-            logger.debug(f"Previous data for {interface_name}: {prev_data}")
+            if debug_enabled:
+                logger.debug(f"Previous data for {interface_name}: {prev_data}")
 
             if not prev_data:
                 # First collection for this interface, store baseline
@@ -472,25 +704,17 @@ class NetworkDataCollector:
                 logger.warning(f"Invalid time delta for {interface_name}: {time_delta}")
                 return None
 
-            # Calculate byte deltas with rollover handling
-            rx_bytes_delta = self._calculate_counter_delta(
-                prev_data.rx_bytes, current_stats['rx_bytes']
-            )
-            tx_bytes_delta = self._calculate_counter_delta(
-                prev_data.tx_bytes, current_stats['tx_bytes']
-            )
-
-            # Calculate packet deltas with rollover handling
-            rx_packets_delta = self._calculate_counter_delta(
-                prev_data.rx_packets, current_stats['rx_packets']
-            )
-            tx_packets_delta = self._calculate_counter_delta(
-                prev_data.tx_packets, current_stats['tx_packets']
+            # Calculate byte and packet deltas with rollover handling, gathering
+            # all four counters from each side in a single call
+            rx_bytes_delta, tx_bytes_delta, rx_packets_delta, tx_packets_delta = map(
+                self._calculate_counter_delta,
+                _get_previous_counters(prev_data),
+                _get_current_counters(current_stats)
             )
 
             return {
                 'interface_name': interface_name,
-                'timestamp': current_time.isoformat(),
+                'timestamp': timestamp if timestamp is not None else current_time.isoformat(),
                 'rx_bytes': rx_bytes_delta,
                 'tx_bytes': tx_bytes_delta,
                 'rx_packets': rx_packets_delta,
@@ -509,7 +733,9 @@ class NetworkDataCollector:
         Calculate counter delta with rollover handling.
 
         Network interface counters can roll over when they reach maximum value.
-        This method handles rollover by detecting when current < previous.
+        Assuming 64-bit unsigned counters (common for network interfaces), the
+        delta is the difference modulo 2^64, which covers both the normal and
+        the rollover case without branching.
 
         Args:
             previous: Previous counter value
@@ -518,14 +744,123 @@ class NetworkDataCollector:
         Returns:
             int: Delta value (always positive)
         """
-        if current >= previous:
-            return current - previous
+        return (current - previous) & COUNTER_MASK
+
+    def _start_writer(self) -> None:
+        """
+        Start the background thread that writes collected rows to the database.
+        """
+        write_queue: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            args=(write_queue,),
+            name='netpulse-writer',
+            daemon=True
+        )
+        self._writer_thread.start()
+        self._write_queue = write_queue
+
+    def _stop_writer(self) -> None:
+        """
+        Stop the background writer after it has written all queued rows.
+        """
+        # Detach the queue under the collection lock so no cycle can enqueue
+        # rows behind the stop marker
+        with self._collection_lock:
+            write_queue, writer_thread = self._write_queue, self._writer_thread
+            self._write_queue = None
+            self._writer_thread = None
+
+        if write_queue is None or writer_thread is None:
+            return
+
+        write_queue.put(_WRITER_STOP)
+        writer_thread.join()
+
+    def _writer_loop(self, write_queue: queue.Queue) -> None:
+        """
+        Write queued collection cycles in batches until the stop marker is received.
+
+        Args:
+            write_queue: Queue of (poll time, rows, error count) entries filled
+                by collection cycles
+        """
+        stopping = False
+        while not stopping:
+            # Wait for the next cycle, then take whatever else is already
+            # queued, up to about WRITE_BATCH_SIZE rows
+            entries = []
+            row_count = 0
+            entry = write_queue.get()
+            while True:
+                if entry is _WRITER_STOP:
+                    stopping = True
+                    break
+                entries.append(entry)
+                row_count += len(entry[1])
+                if row_count >= WRITE_BATCH_SIZE:
+                    break
+                try:
+                    entry = write_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if entries:
+                self._write_cycles(entries)
+
+    def _write_cycles(self, entries: List[tuple]) -> None:
+        """
+        Store the rows of queued collection cycles in one transaction and
+        record the cycles in the statistics.
+
+        Failed writes are retried with backoff; retrying stops once collection
+        is stopped. Cycles whose rows could not be stored are recorded as
+        failed polls, with one error per row, as they are when collect_once
+        fails to store.
+
+        Args:
+            entries: (poll time, rows, error count) entries taken from the write queue
+        """
+        rows = [row for _, cycle_rows, _ in entries for row in cycle_rows]
+        try:
+            self._retry_operation(lambda: self._store_traffic_data_batch(rows), "Storing traffic data")
+        except CollectionError:
+            with self._lock:
+                self._stats.dropped_writes += len(rows)
+            for poll_time, cycle_rows, error_count in entries:
+                self._record_poll(error_count + len(cycle_rows), poll_time)
         else:
-            # Counter rollover detected
-            # Assuming 64-bit counters (common for network interfaces)
-            # Max value for 64-bit unsigned int is 2^64 - 1
-            max_counter_value = 2**64 - 1
-            return (max_counter_value - previous) + current
+            for poll_time, _, error_count in entries:
+                self._record_poll(error_count, poll_time)
+
+    def _enqueue_traffic_data(self,
+                              write_queue: queue.Queue,
+                              poll_time: datetime,
+                              rows: List[Dict[str, Any]],
+                              error_count: int) -> bool:
+        """
+        Queue a collection cycle's traffic data rows for the background writer.
+
+        A cycle that does not fit in the queue is dropped and counted in the
+        collection statistics rather than blocking the collection cycle.
+
+        Args:
+            write_queue: Queue consumed by the background writer
+            poll_time: Time the cycle read the counters
+            rows: Traffic data rows to write
+            error_count: Number of errors the cycle already reported
+
+        Returns:
+            bool: True if the rows were queued
+        """
+        try:
+            write_queue.put_nowait((poll_time, rows, error_count))
+        except queue.Full:
+            logger.warning(f"Write queue full, dropped {len(rows)} traffic data rows")
+            with self._lock:
+                self._stats.dropped_writes += len(rows)
+            return False
+        return True
 
     def _store_traffic_data(self, data: Dict[str, Any]) -> None:
         """
@@ -547,21 +882,43 @@ class NetworkDataCollector:
             logger.error(f"Failed to store traffic data: {e}")
             raise
 
-    def _update_previous_data(self, interface_name: str, current_stats: Dict[str, Any]) -> None:
+    def _store_traffic_data_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Store a collection cycle's traffic data in the database in one transaction.
+
+        Args:
+            rows: Traffic data records to store
+        """
+        try:
+            insert_traffic_data_batch(rows)
+        except DatabaseError as e:
+            logger.error(f"Failed to store traffic data batch: {e}")
+            raise
+
+    def _update_previous_data(self,
+                              interface_name: str,
+                              current_stats: Dict[str, Any],
+                              timestamp: Optional[datetime] = None) -> None:
         """
         Update previous data for next delta calculation.
 
         Args:
             interface_name: Interface name
             current_stats: Current interface statistics
+            timestamp: Time the statistics were read (default: now)
         """
-        self._previous_data[interface_name] = InterfaceData(
-            rx_bytes=current_stats['rx_bytes'],
-            tx_bytes=current_stats['tx_bytes'],
-            rx_packets=current_stats['rx_packets'],
-            tx_packets=current_stats['tx_packets'],
-            timestamp=datetime.now()
-        )
+        # Read the counters first so a malformed stats dict never leaves a half-filled entry
+        counters = _get_current_counters(current_stats)
+
+        entry = self._previous_data.get(interface_name)
+        if entry is None:
+            # Every slot is assigned below, so skip running __init__ with defaults
+            entry = InterfaceData.__new__(InterfaceData)
+            self._previous_data[interface_name] = entry
+
+        # Update the entry in place rather than replacing it every cycle
+        entry.rx_bytes, entry.tx_bytes, entry.rx_packets, entry.tx_packets = counters
+        entry.timestamp = timestamp if timestamp is not None else datetime.now()
 
     def _get_monitored_interfaces(self) -> List[str]:
         """
@@ -574,13 +931,13 @@ class NetworkDataCollector:
             interfaces_str = get_configuration_value(self._config_keys['monitored_interfaces'])
             if interfaces_str:
                 interfaces = [iface.strip() for iface in interfaces_str.split(',') if iface.strip()]
-                # Validate interfaces exist
-                valid_interfaces = []
-                for iface in interfaces:
-                    if validate_interface(iface):
-                        valid_interfaces.append(iface)
-                    else:
-                        logger.warning(f"Configured interface {iface} not found or not active")
+                # Validate interfaces exist, reading system interface state once for all of them
+                valid_interfaces = validate_interfaces(interfaces)
+                if len(valid_interfaces) != len(interfaces):
+                    valid = set(valid_interfaces)
+                    for iface in interfaces:
+                        if iface not in valid:
+                            logger.warning(f"Configured interface {iface} not found or not active")
                 return valid_interfaces
         except DatabaseError as e:
             logger.error(f"Failed to get monitored interfaces from config: {e}")
@@ -594,34 +951,58 @@ class NetworkDataCollector:
         Returns:
             Dict[str, Any]: Current configuration
         """
-        config = {}
-        for key_name, key in self._config_keys.items():
-            try:
-                value = get_configuration_value(key)
-                config[key_name] = value
-            except DatabaseError:
-                config[key_name] = None
-        return config
+        try:
+            values = get_configuration_values_batch(list(self._config_keys.values()))
+        except DatabaseError:
+            values = {}
+        return {key_name: values.get(key) for key_name, key in self._config_keys.items()}
+
+    def _retry_backoff_delay(self, attempt: int) -> float:
+        """
+        Calculate the delay before the next retry attempt.
 
-    @contextmanager
-    def _retry_operation(self, operation_name: str):
+        The delay grows exponentially from retry_delay, with random jitter to
+        spread out retries from concurrent callers, and is capped at
+        max_retry_delay.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            float: Delay in seconds
+        """
+        delay = self.retry_delay * (2 ** attempt) * (1 + random.uniform(0, self.retry_jitter))
+        return min(self.max_retry_delay, delay)
+
+    def _retry_operation(self, operation: Callable[[], Any], operation_name: str) -> Any:
         """
-        Context manager for retrying operations.
+        Run an operation, retrying with exponential backoff on failure.
+
+        The wait between attempts ends early when collection is stopped, so a
+        retrying operation does not hold up shutdown.
 
         Args:
+            operation: Callable to run
             operation_name: Name of the operation for logging
+
+        Returns:
+            Any: Result of the operation
+
+        Raises:
+            CollectionError: If all attempts fail or collection is stopped while waiting
         """
         last_error = None
 
         for attempt in range(self.max_retries):
             try:
-                yield
-                return
+                return operation()
             except Exception as e:
                 last_error = e
                 if attempt < self.max_retries - 1:
-                    logger.warning(f"{operation_name} failed (attempt {attempt + 1}), retrying in {self.retry_delay}s: {e}")
-                    time.sleep(self.retry_delay)
+                    delay = self._retry_backoff_delay(attempt)
+                    logger.warning(f"{operation_name} failed (attempt {attempt + 1}), retrying in {delay:.2f}s: {e}")
+                    if self._stop_event.wait(delay):
+                        raise CollectionError(f"{operation_name} aborted: collection stopped")
                 else:
                     logger.error(f"{operation_name} failed after {self.max_retries} attempts: {e}")
 
@@ -665,18 +1046,34 @@ def get_collector() -> NetworkDataCollector:
     """
     global _collector_instance
 
-    if _collector_instance is None:
-        with _collector_lock:
-            if _collector_instance is None:
-                try:
-                    _collector_instance = NetworkDataCollector()
-                except CollectorError as e:
-                    logger.error(f"Failed to create collector: {e}")
-                    raise
+    # Fast path: a single global read, no lock once the instance exists
+    collector = _collector_instance
+    if collector is not None:
+        return collector
+
+    with _collector_lock:
+        if _collector_instance is None:
+            try:
+                _collector_instance = NetworkDataCollector()
+            except CollectorError as e:
+                logger.error(f"Failed to create collector: {e}")
+                raise
+        return _collector_instance
+
+def shutdown_collector() -> None:
+    """
+    Stop the global collector, if it was created and is running.
+
+    Collection cycles still waiting in the write queue are stored before
+    this returns. Called when the application shuts down.
+    """
+    collector = _collector_instance
+    if collector is not None and not collector.can_start():
+        collector.stop_collection()
 
-    return _collector_instance
 
 def reset_collector():
     """Reset the global collector instance."""
     global _collector_instance
-    _collector_instance = None
\ No newline at end of file
+    with _collector_lock:
+        _collector_instance = None
\ No newline at end of file
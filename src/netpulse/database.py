@@ -8,6 +8,7 @@ This module handles all database operations for Net-Pulse, including:
 - CRUD operations for network traffic data and configuration settings
 """
 
+import os
 import sqlite3
 import logging
 from pathlib import Path
@@ -19,8 +20,25 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database file path - created in project root
-DB_PATH = Path(__file__).parent.parent.parent / "netpulse.db"
+def _default_db_path() -> Path:
+    """
+    Get the database path to use at startup.
+
+    Returns:
+        Path: NETPULSE_DB_PATH if set, otherwise netpulse.db in the project root
+    """
+    env_path = os.environ.get("NETPULSE_DB_PATH")
+    if env_path:
+        return Path(env_path)
+    return Path(__file__).parent.parent.parent / "netpulse.db"
+
+
+# Database file path - created in project root unless NETPULSE_DB_PATH is set
+DB_PATH = _default_db_path()
+
+# Seconds a connection waits for another writer's lock before failing with
+# "database is locked" (sqlite3's default is 5)
+BUSY_TIMEOUT = 10.0
 
 def get_db_path():
     """Get the current database path."""
@@ -69,8 +87,11 @@ def get_db_connection(db_url: Optional[str] = None):
     if db_to_connect.startswith("sqlite:///"):
         db_to_connect = db_to_connect[10:]
     try:
-        conn = sqlite3.connect(db_to_connect)
+        conn = sqlite3.connect(db_to_connect, timeout=BUSY_TIMEOUT)
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        # In WAL mode (set by initialize_database) NORMAL only syncs the log at
+        # checkpoints rather than on every commit, and stays crash-consistent
+        conn.execute("PRAGMA synchronous=NORMAL")
         yield conn
     except sqlite3.Error as e:
         logger.error(f"Database connection error: {e}")
@@ -101,6 +122,11 @@ def initialize_database(db_url: Optional[str] = None) -> None:
         with get_db_connection(db_to_connect) as conn:
             cursor = conn.cursor()
 
+            # Write-ahead logging turns each commit into an append to the log
+            # and lets readers run alongside the collector's writes. The mode is
+            # stored in the database file, so setting it once here is enough.
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             # Create traffic_data table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS traffic_data (
@@ -197,6 +223,92 @@ def insert_traffic_data(
         raise DatabaseError(f"Failed to insert traffic data: {e}")
 
 
+def insert_traffic_data_batch(records: List[Dict[str, Any]]) -> int:
+    """
+    Insert multiple traffic data records in a single transaction.
+
+    The insert is idempotent: a record whose interface already has a row with
+    the same timestamp is skipped, so a batch can be safely retried after a
+    failure that happened once the data was already committed.
+
+    Args:
+        records: Traffic data records, each with the same keys as the
+            arguments of insert_traffic_data()
+
+    Returns:
+        int: Number of records inserted
+
+    Raises:
+        DatabaseError: If insertion fails (no records are inserted)
+    """
+    if not records:
+        return 0
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO traffic_data (
+                    timestamp, interface_name, rx_bytes, tx_bytes,
+                    rx_packets, tx_packets
+                )
+                SELECT ?, ?, ?, ?, ?, ?
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM traffic_data
+                    WHERE timestamp = ? AND interface_name = ?
+                )
+            """, [
+                (record['timestamp'], record['interface_name'],
+                 record['rx_bytes'], record['tx_bytes'],
+                 record['rx_packets'], record['tx_packets'],
+                 record['timestamp'], record['interface_name'])
+                for record in records
+            ])
+
+            conn.commit()
+            inserted = cursor.rowcount
+            logger.debug(f"Inserted {inserted} of {len(records)} traffic data records")
+            return inserted
+
+    except (sqlite3.Error, KeyError) as e:
+        logger.error(f"Failed to insert traffic data batch: {e}")
+        raise DatabaseError(f"Failed to insert traffic data batch: {e}")
+
+
+def _traffic_data_filters(
+    interface_name: Optional[str] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None
+) -> Tuple[str, List[Any]]:
+    """
+    Build the WHERE clause shared by the traffic data queries.
+
+    Args:
+        interface_name: Filter by specific interface name
+        start_time: Filter records from this timestamp (ISO format)
+        end_time: Filter records until this timestamp (ISO format)
+
+    Returns:
+        Tuple[str, List[Any]]: WHERE clause and its parameters
+    """
+    where = " WHERE 1=1"
+    params = []
+
+    if interface_name:
+        where += " AND interface_name = ?"
+        params.append(interface_name)
+
+    if start_time:
+        where += " AND timestamp >= ?"
+        params.append(start_time)
+
+    if end_time:
+        where += " AND timestamp <= ?"
+        params.append(end_time)
+
+    return where, params
+
+
 def get_traffic_data(
     limit: Optional[int] = None,
     offset: Optional[int] = None,
@@ -225,26 +337,12 @@ def get_traffic_data(
             cursor = conn.cursor()
 
             # Build query dynamically based on filters
+            where, params = _traffic_data_filters(interface_name, start_time, end_time)
             query = """
                 SELECT id, timestamp, interface_name, rx_bytes, tx_bytes,
                        rx_packets, tx_packets, created_at
                 FROM traffic_data
-                WHERE 1=1
-            """
-
-            params = []
-
-            if interface_name:
-                query += " AND interface_name = ?"
-                params.append(interface_name)
-
-            if start_time:
-                query += " AND timestamp >= ?"
-                params.append(start_time)
-
-            if end_time:
-                query += " AND timestamp <= ?"
-                params.append(end_time)
+            """ + where
 
             query += " ORDER BY timestamp DESC"
 
@@ -285,6 +383,38 @@ def get_traffic_data(
         raise DatabaseError(f"Failed to retrieve traffic data: {e}")
 
 
+def count_traffic_data(
+    interface_name: Optional[str] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None
+) -> int:
+    """
+    Count traffic data records with optional filtering, without reading them.
+
+    Args:
+        interface_name: Filter by specific interface name
+        start_time: Filter records from this timestamp (ISO format)
+        end_time: Filter records until this timestamp (ISO format)
+
+    Returns:
+        int: Number of matching records
+
+    Raises:
+        DatabaseError: If query fails
+    """
+    try:
+        with get_db_connection() as conn:
+            where, params = _traffic_data_filters(interface_name, start_time, end_time)
+            count = int(conn.execute("SELECT COUNT(*) FROM traffic_data" + where, params).fetchone()[0])
+
+            logger.debug(f"Counted {count} traffic data records")
+            return count
+
+    except sqlite3.Error as e:
+        logger.error(f"Failed to count traffic data: {e}")
+        raise DatabaseError(f"Failed to count traffic data: {e}")
+
+
 def get_configuration_value(key: str) -> Optional[str]:
     """
     Get a configuration value by key.
@@ -316,6 +446,40 @@ def get_configuration_value(key: str) -> Optional[str]:
         raise DatabaseError(f"Failed to get configuration value: {e}")
 
 
+def get_configuration_values_batch(keys: List[str]) -> Dict[str, str]:
+    """
+    Get several configuration values with a single query.
+
+    Args:
+        keys: Configuration keys
+
+    Returns:
+        Dict[str, str]: Configuration values by key; keys that don't exist
+        are left out
+
+    Raises:
+        DatabaseError: If query fails
+    """
+    if not keys:
+        return {}
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ", ".join("?" * len(keys))
+            cursor.execute(
+                f"SELECT key, value FROM configuration WHERE key IN ({placeholders})",
+                list(keys)
+            )
+            values = {row['key']: row['value'] for row in cursor.fetchall()}
+            logger.debug(f"Retrieved {len(values)} of {len(keys)} configuration values")
+            return values
+
+    except sqlite3.Error as e:
+        logger.error(f"Failed to get configuration values: {e}")
+        raise DatabaseError(f"Failed to get configuration values: {e}")
+
+
 def set_configuration_value(key: str, value: str) -> None:
     """
     Set or update a configuration value.
@@ -348,6 +512,37 @@ def set_configuration_value(key: str, value: str) -> None:
         raise DatabaseError(f"Failed to set configuration value: {e}")
 
 
+def set_configuration_values_batch(values: Dict[str, str]) -> None:
+    """
+    Set or update several configuration values in a single transaction.
+
+    Args:
+        values: Configuration values by key
+
+    Raises:
+        DatabaseError: If operation fails
+    """
+    if not values:
+        return
+
+    try:
+        with get_db_connection() as conn:
+            conn.executemany("""
+                INSERT INTO configuration (key, value, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    updated_at = CURRENT_TIMESTAMP
+            """, list(values.items()))
+
+            conn.commit()
+            logger.debug(f"Set {len(values)} configuration values")
+
+    except sqlite3.Error as e:
+        logger.error(f"Failed to set configuration values: {e}")
+        raise DatabaseError(f"Failed to set configuration values: {e}")
+
+
 def get_database_stats() -> Dict[str, Any]:
     """
     Get database statistics for monitoring.
@@ -360,15 +555,14 @@ def get_database_stats() -> Dict[str, Any]:
     """
     try:
         with get_db_connection() as conn:
-            cursor = conn.cursor()
-
-            # Get traffic data count
-            cursor.execute("SELECT COUNT(*) as count FROM traffic_data")
-            traffic_count = cursor.fetchone()['count']
-
-            # Get configuration count
-            cursor.execute("SELECT COUNT(*) as count FROM configuration")
-            config_count = cursor.fetchone()['count']
+            # Get both table counts in one round trip
+            counts = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM traffic_data) AS traffic_count,
+                    (SELECT COUNT(*) FROM configuration) AS config_count
+            """).fetchone()
+            traffic_count = counts['traffic_count']
+            config_count = counts['config_count']
 
             # Get database file size
             db_size = DB_PATH.stat().st_size if DB_PATH.exists() else 0
@@ -389,6 +583,29 @@ def get_database_stats() -> Dict[str, Any]:
 # Use a flag to track if we've been initialized to avoid duplicate initialization
 _initialized = False
 
+def is_initialized() -> bool:
+    """
+    Check whether the database schema has been created.
+
+    Returns:
+        bool: True if the traffic_data and configuration tables exist
+
+    Raises:
+        DatabaseError: If query fails
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.execute("""
+                SELECT COUNT(*) FROM sqlite_master
+                WHERE type = 'table' AND name IN ('traffic_data', 'configuration')
+            """)
+            return bool(cursor.fetchone()[0] == 2)
+
+    except sqlite3.Error as e:
+        logger.error(f"Failed to check database initialization: {e}")
+        raise DatabaseError(f"Failed to check database initialization: {e}")
+
+
 def _ensure_initialized():
     """Ensure database is initialized, but only once."""
     global _initialized
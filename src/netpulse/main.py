@@ -9,10 +9,11 @@ import uvicorn
 from fastapi import FastAPI, HTTPException, Query, Path
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 import csv
 import io
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 from netpulse import __version__
@@ -22,7 +23,9 @@ from netpulse.network import (
     validate_interface, get_primary_interface, get_interface_traffic_summary,
     NetworkError, InterfaceNotFoundError
 )
-from netpulse.collector import get_collector, initialize_collector_config, CollectorError
+from netpulse.collector import (
+    get_collector, initialize_collector_config, shutdown_collector, CollectorError
+)
 from netpulse.autodetect import initialize_auto_detection, AutoDetectionError
 
 # Configure logging
@@ -120,9 +123,17 @@ class ErrorResponse(BaseModel):
     path: Optional[str] = None
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Stop the collector on shutdown, so rows still waiting to be written are stored."""
+    yield
+    shutdown_collector()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     app = FastAPI(
+        lifespan=lifespan,
         title="Net-Pulse",
         description="Lightweight network traffic monitoring application",
         version=__version__,
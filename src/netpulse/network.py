@@ -6,21 +6,31 @@ This module provides network interface discovery and traffic monitoring
 functionality using psutil for cross-platform compatibility.
 
 Functions:
-    - get_network_interfaces(): Discover available network interfaces
+    - get_network_interfaces(): Discover available network interfaces (cached briefly)
+    - clear_interface_cache(): Drop the cached interface discovery result
     - get_interface_stats(): Get traffic statistics for a specific interface
     - get_all_interface_stats(): Get traffic statistics for all interfaces
     - validate_interface(): Validate if an interface exists and is active
+    - validate_interfaces(): Validate several interfaces with one read of system state
     - get_primary_interface(): Identify the primary interface based on traffic
 """
 
 import psutil
 import logging
+import time
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Seconds a get_network_interfaces() result is reused before interfaces are
+# enumerated again; enumeration reads every address of every interface
+INTERFACE_CACHE_TTL = 2.0
+
+# (time.monotonic() of the read, interface details) of the last discovery
+_interface_cache: Optional[Tuple[float, Dict[str, Dict[str, Any]]]] = None
+
 
 class NetworkError(Exception):
     """Custom exception for network operations."""
@@ -37,10 +47,20 @@ class PermissionError(NetworkError):
     pass
 
 
+def clear_interface_cache() -> None:
+    """Make the next get_network_interfaces() call enumerate interfaces again."""
+    global _interface_cache
+    _interface_cache = None
+
+
 def get_network_interfaces() -> Dict[str, Dict[str, Any]]:
     """
     Discover and return available network interfaces with their details.
 
+    Results are reused for INTERFACE_CACHE_TTL seconds, so callers polling
+    more often than that share one enumeration. The interface details are
+    shared between callers and must not be modified.
+
     Returns:
         Dict[str, Dict[str, Any]]: Dictionary of interface names mapped to their details
             including addresses, netmask, broadcast, etc.
@@ -48,6 +68,12 @@ def get_network_interfaces() -> Dict[str, Dict[str, Any]]:
     Raises:
         NetworkError: If unable to retrieve network interfaces
     """
+    global _interface_cache
+
+    cached = _interface_cache
+    if cached is not None and time.monotonic() - cached[0] < INTERFACE_CACHE_TTL:
+        return dict(cached[1])
+
     try:
         interfaces = psutil.net_if_addrs()
         logger.debug(f"Discovered {len(interfaces)} network interfaces")
@@ -81,7 +107,8 @@ def get_network_interfaces() -> Dict[str, Dict[str, Any]]:
 
             interface_details[interface_name] = interface_info
 
-        return interface_details
+        _interface_cache = (time.monotonic(), interface_details)
+        return dict(interface_details)
 
     except Exception as e:
         logger.error(f"Failed to get network interfaces: {e}")
@@ -223,6 +250,46 @@ def validate_interface(interface_name: str) -> bool:
         return False
 
 
+def validate_interfaces(interface_names: List[str]) -> List[str]:
+    """
+    Validate several network interfaces at once.
+
+    Applies the same checks as validate_interface(), but reads interface
+    addresses and status once for all names instead of once per name.
+
+    Args:
+        interface_names: Names of the network interfaces to validate
+
+    Returns:
+        List[str]: Names of the interfaces that exist and are active, in input order
+    """
+    try:
+        interfaces = psutil.net_if_addrs()
+
+        try:
+            stats = psutil.net_if_stats()
+        except Exception:
+            # If we can't get status, assume interfaces with addresses are valid
+            stats = None
+
+    except Exception as e:
+        logger.debug(f"Error validating interfaces {interface_names}: {e}")
+        return []
+
+    valid_interfaces = []
+    for interface_name in interface_names:
+        if interface_name not in interfaces:
+            continue
+
+        if stats is None:
+            if len(interfaces[interface_name]) > 0:
+                valid_interfaces.append(interface_name)
+        elif interface_name in stats and stats[interface_name].isup:
+            valid_interfaces.append(interface_name)
+
+    return valid_interfaces
+
+
 def get_primary_interface() -> Optional[str]:
     """
     Identify the primary network interface based on traffic activity.
@@ -2,32 +2,65 @@
 Pytest configuration and fixtures for Net-Pulse tests.
 """
 
+import atexit
+import dataclasses
+import itertools
+import os
+import shutil
+import sqlite3
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import Mock, create_autospec, patch
+
+import psutil
 import pytest
 from fastapi.testclient import TestClient
 
+from netpulse import network
 from netpulse.main import create_app
+from netpulse.collector import CollectionStats, InterfaceData
+from netpulse.network import NetworkError, InterfaceNotFoundError, PermissionError
+from netpulse.database import DatabaseError
 
 
-@pytest.fixture(scope="function")
-def app(test_database_url, monkeypatch):
-    """Create and configure a test instance of the FastAPI application."""
+def _create_test_app(db_url):
+    """Create a FastAPI application that uses the given test database."""
     from netpulse.database import set_db_path, initialize_database
     # Set database path first
-    set_db_path(test_database_url)
+    set_db_path(db_url)
     # Then initialize with the new path
     initialize_database()
     app = create_app()
-    app.state.db_url = test_database_url
+    app.state.db_url = db_url
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def app(test_database_url):
+    """
+    Create and configure a test instance of the FastAPI application.
+
+    The application keeps no per-request state, so one instance serves the
+    whole session (one per pytest-xdist worker).
+    """
+    return _create_test_app(test_database_url)
+
+
+@pytest.fixture(scope="session")
 def client(app):
-    """Create a test client for the FastAPI application."""
+    """Create a test client for the FastAPI application, shared by the session."""
     with TestClient(app) as client:
         yield client
 
 
+@pytest.fixture
+def isolated_client(test_database_url):
+    """Create a test client for a freshly created application, for tests that change the app."""
+    with TestClient(_create_test_app(test_database_url)) as client:
+        yield client
+
+
 @pytest.fixture
 def sample_network_data():
     """Provide sample network data for testing."""
@@ -51,33 +84,71 @@ def mock_network_interface():
     }
 
 
-@pytest.fixture(scope="function")
-def test_database_url(tmp_path):
-    """Provide a temporary database URL for each test function."""
-    db_path = tmp_path / "test.db"
-    return f"sqlite:///{db_path}"
+# RAM-backed filesystem for the session database, where the platform has one
+_SHARED_MEMORY_DIR = Path("/dev/shm")
 
 
-@pytest.fixture(autouse=True)
-def cleanup_database(test_database_url, monkeypatch):
-    """Cleanup database before and after each test."""
-    from netpulse.database import set_db_path, initialize_database
-    import os
+@pytest.fixture(scope="session")
+def test_database_url(tmp_path_factory):
+    """
+    Provide a temporary database URL shared by the test session.
 
-    # Ensure database file doesn't exist before test
-    db_path = test_database_url.replace("sqlite:///", "")
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    Under pytest-xdist each worker has its own temporary directory, and so its
+    own database file. The file is kept in /dev/shm when it exists, so commits
+    never wait on the disk; a file rather than a shared-cache in-memory
+    database keeps the data across connections and lets the collector's
+    threads read and write concurrently. Directories in /dev/shm are outside
+    pytest's basetemp, so their removal is registered with atexit as soon as
+    they are created and still happens when the session is interrupted.
+    """
+    from netpulse.database import set_db_path
 
-    # Set database path and initialize
+    if _SHARED_MEMORY_DIR.is_dir():
+        db_dir = Path(tempfile.mkdtemp(prefix="netpulse-", dir=_SHARED_MEMORY_DIR))
+        atexit.register(shutil.rmtree, db_dir, ignore_errors=True)
+    else:
+        db_dir = tmp_path_factory.mktemp("database")
+    db_path = db_dir / "test.db"
+    db_url = f"sqlite:///{db_path}"
+
+    # Create the schema, then an index for the per-interface time-range
+    # queries the tests run (newest rows first)
+    set_db_path(db_url)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_traffic_iface_ts
+            ON traffic_data(interface_name, timestamp DESC)
+        """)
+        conn.commit()
+    finally:
+        conn.close()
+
+    yield db_url
+
+    shutil.rmtree(db_dir, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_database(test_database_url):
+    """Point the database module at the session database and empty it before each test."""
+    from netpulse.database import set_db_path
+
+    # The schema already exists, so this only switches the path back
     set_db_path(test_database_url)
-    initialize_database()
 
-    yield
+    # Clearing the rows is much cheaper than deleting and re-creating the file.
+    # Connect directly, since tests may have swapped out get_db_connection.
+    conn = sqlite3.connect(test_database_url.replace("sqlite:///", ""))
+    try:
+        conn.execute("DELETE FROM traffic_data")
+        conn.execute("DELETE FROM configuration")
+        conn.execute("DELETE FROM sqlite_sequence")
+        conn.commit()
+    finally:
+        conn.close()
 
-    # Cleanup database file after test
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    yield
 
 
 @pytest.fixture(autouse=True)
@@ -91,4 +162,262 @@ def cleanup_collector(monkeypatch):
     yield
 
     # Cleanup after test
-    netpulse.collector._collector_instance = None
\ No newline at end of file
+    netpulse.collector._collector_instance = None
+
+
+@pytest.fixture(autouse=True)
+def clear_interface_cache():
+    """Make every test enumerate network interfaces afresh, so psutil mocks take effect."""
+    network.clear_interface_cache()
+
+    yield
+
+    network.clear_interface_cache()
+
+
+@pytest.fixture(scope="session")
+def _netio_snapshot():
+    """Read the real per-interface I/O counters once for the whole session."""
+    return psutil.net_io_counters(pernic=True)
+
+
+@pytest.fixture(autouse=True)
+def _fake_netio(request, monkeypatch):
+    """
+    Serve psutil.net_io_counters from a session snapshot when NETPULSE_FAKE_NETIO is set.
+
+    Each call returns the snapshot with counters grown by a fixed step, so the
+    interfaces keep their real names and still show traffic without a system
+    call per reading. Tests that need real counters opt out with
+    @pytest.mark.real_netio.
+    """
+    if not os.environ.get("NETPULSE_FAKE_NETIO") or request.node.get_closest_marker("real_netio"):
+        return
+
+    snapshot = request.getfixturevalue("_netio_snapshot")
+    calls = itertools.count(1)
+
+    def fake_net_io_counters(pernic=False, nowrap=True):
+        step = next(calls)
+        counters = {
+            name: io._replace(
+                bytes_sent=io.bytes_sent + step * 500,
+                bytes_recv=io.bytes_recv + step * 1500,
+                packets_sent=io.packets_sent + step,
+                packets_recv=io.packets_recv + step
+            )
+            for name, io in snapshot.items()
+        }
+        if pernic:
+            return counters
+        return type(next(iter(snapshot.values())))(*map(sum, zip(*counters.values())))
+
+    monkeypatch.setattr(psutil, "net_io_counters", fake_net_io_counters)
+
+
+# Collector test data and mocking fixtures (shared by tests/test_collector_*.py)
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+_BASE_STATS = CollectionStats(
+    total_polls=10,
+    successful_polls=8,
+    failed_polls=2,
+    interfaces_monitored=3,
+    total_errors=5,
+    consecutive_failures=1
+)
+
+
+# Test Data Fixtures
+@pytest.fixture
+def sample_interface_stats():
+    """Provide sample interface statistics for testing."""
+    return {
+        'interface_name': 'eth0',
+        'rx_bytes': 1000000,
+        'tx_bytes': 500000,
+        'rx_packets': 10000,
+        'tx_packets': 5000,
+        'timestamp': '2024-01-01T12:00:00'
+    }
+
+
+@pytest.fixture
+def sample_interface_data():
+    """Provide sample InterfaceData for testing."""
+    return InterfaceData(
+        rx_bytes=1000000,
+        tx_bytes=500000,
+        rx_packets=10000,
+        tx_packets=5000,
+        timestamp=_FROZEN_NOW
+    )
+
+
+@pytest.fixture
+def sample_collection_stats():
+    """Provide sample CollectionStats for testing."""
+    return dataclasses.replace(
+        _BASE_STATS,
+        last_poll_time=_FROZEN_NOW,
+        last_successful_poll=_FROZEN_NOW
+    )
+
+
+@pytest.fixture
+def mock_network_stats():
+    """Provide mock network statistics for multiple interfaces."""
+    return {
+        'eth0': {
+            'interface_name': 'eth0',
+            'rx_bytes': 1000000,
+            'tx_bytes': 500000,
+            'rx_packets': 10000,
+            'tx_packets': 5000,
+            'timestamp': '2024-01-01T12:00:00'
+        },
+        'eth1': {
+            'interface_name': 'eth1',
+            'rx_bytes': 2000000,
+            'tx_bytes': 1000000,
+            'rx_packets': 20000,
+            'tx_packets': 10000,
+            'timestamp': '2024-01-01T12:00:00'
+        },
+        'wlan0': {
+            'interface_name': 'wlan0',
+            'rx_bytes': 500000,
+            'tx_bytes': 250000,
+            'rx_packets': 5000,
+            'tx_packets': 2500,
+            'timestamp': '2024-01-01T12:00:00'
+        }
+    }
+
+
+@pytest.fixture
+def mock_delta_data():
+    """Provide mock delta calculation results."""
+    return {
+        'interface_name': 'eth0',
+        'timestamp': '2024-01-01T12:01:00',
+        'rx_bytes': 1000,
+        'tx_bytes': 500,
+        'rx_packets': 10,
+        'tx_packets': 5,
+        'collection_interval_seconds': 60.0
+    }
+
+
+@pytest.fixture
+def mock_config_data():
+    """Provide mock configuration data for testing."""
+    return {
+        'monitored_interfaces': 'eth0,eth1',
+        'polling_interval': '30',
+        'max_retries': '3',
+        'retry_delay': '1.0'
+    }
+
+
+@pytest.fixture
+def mock_error_scenarios():
+    """Provide various error scenarios for testing."""
+    return {
+        'interface_not_found': InterfaceNotFoundError("Interface 'nonexistent' not found"),
+        'network_error': NetworkError("Network operation failed"),
+        'database_error': DatabaseError("Database connection failed"),
+        'permission_error': PermissionError("Permission denied"),
+        'scheduler_error': Exception("Scheduler initialization failed")
+    }
+
+
+# Mocking Strategy Fixtures
+@pytest.fixture
+def mock_apscheduler():
+    """Mock APScheduler components for testing."""
+    with patch('netpulse.collector.APSCHEDULER_AVAILABLE', True), \
+         patch('netpulse.collector.BackgroundScheduler') as mock_scheduler, \
+         patch('netpulse.collector.IntervalTrigger') as mock_trigger:
+
+        # Configure mock scheduler
+        mock_scheduler_instance = Mock()
+        mock_scheduler.return_value = mock_scheduler_instance
+
+        # Configure mock trigger
+        mock_trigger_instance = Mock()
+        mock_trigger.return_value = mock_trigger_instance
+
+        yield {
+            'scheduler': mock_scheduler_instance,
+            'trigger': mock_trigger_instance,
+            'scheduler_class': mock_scheduler,
+            'trigger_class': mock_trigger
+        }
+
+
+@pytest.fixture
+def mock_network_module():
+    """Mock the network module for controlled testing."""
+    # Autospecced function mocks resolve attributes against the real function
+    # instead of growing MagicMock children, and reject calls with a bad signature.
+    mock_get_all = create_autospec(network.get_all_interface_stats, return_value={})
+    mock_validate = create_autospec(network.validate_interfaces, side_effect=list)
+
+    with patch('netpulse.collector.get_all_interface_stats', new=mock_get_all), \
+         patch('netpulse.collector.validate_interfaces', new=mock_validate):
+
+        yield {
+            'get_all': mock_get_all,
+            'validate': mock_validate
+        }
+
+
+@pytest.fixture
+def mock_database_module():
+    """Mock the database module for controlled testing."""
+    with patch('netpulse.collector.insert_traffic_data') as mock_insert, \
+         patch('netpulse.collector.insert_traffic_data_batch') as mock_insert_batch, \
+         patch('netpulse.collector.get_configuration_value') as mock_get_config, \
+         patch('netpulse.collector.get_configuration_values_batch') as mock_get_config_batch, \
+         patch('netpulse.collector.set_configuration_value') as mock_set_config:
+
+        # Configure default return values
+        mock_insert.return_value = 1
+        mock_insert_batch.side_effect = len
+        mock_get_config.return_value = None
+        mock_get_config_batch.return_value = {}
+        mock_set_config.return_value = True
+
+        yield {
+            'insert': mock_insert,
+            'insert_batch': mock_insert_batch,
+            'get_config': mock_get_config,
+            'get_config_batch': mock_get_config_batch,
+            'set_config': mock_set_config
+        }
+
+
+@pytest.fixture
+def mock_time_module():
+    """Mock time-related functions for consistent timing tests."""
+    base_time = _FROZEN_NOW
+
+    with patch('netpulse.collector.datetime') as mock_datetime:
+        # Create a counter to track time progression
+        time_counter = {'current': base_time}
+
+        def mock_now():
+            return time_counter['current']
+
+        def mock_utcnow():
+            return time_counter['current']
+
+        mock_datetime.now.side_effect = mock_now
+        mock_datetime.utcnow.side_effect = lambda: time_counter['current'].replace(tzinfo=timezone.utc)
+
+        yield {
+            'datetime': mock_datetime,
+            'base_time': base_time,
+            'time_counter': time_counter
+        }
\ No newline at end of file
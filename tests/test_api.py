@@ -883,6 +883,11 @@ class TestPerformance(TestAPIBase):
 class TestAPIDocumentation(TestAPIBase):
     """Test API documentation and OpenAPI schema."""
 
+    @pytest.fixture(scope="class")
+    def app(self):
+        """Create one FastAPI application for the class, so its OpenAPI schema is generated once."""
+        return create_app()
+
     @pytest.mark.fast
 
     def test_openapi_schema_exists(self, client):
@@ -178,6 +178,29 @@ class TestInterfaceAnalyzer:
     #     # Verify database calls
     #     assert mock_database.set_configuration_value.call_count >= 3  # interface config + primary + completion flag
 
+    def test_monitor_traffic_patterns_sample_count(self, analyzer):
+        """Test monitoring traffic for a fixed number of samples."""
+        stats = {
+            'timestamp': '2024-01-01T12:00:00',
+            'rx_bytes': 1000,
+            'tx_bytes': 500,
+            'rx_packets': 10,
+            'tx_packets': 5
+        }
+        analyzer.network_module = MagicMock()
+        analyzer.network_module.get_interface_stats.return_value = stats
+
+        with mock.patch('netpulse.autodetect.time.sleep') as mock_sleep:
+            result = analyzer._monitor_traffic_patterns(['eth0', 'wlan0'], sample_count=3)
+
+        assert [len(samples) for samples in result.values()] == [3, 3]
+        assert mock_sleep.call_count == 2  # Only between samples
+
+    def test_monitor_traffic_patterns_requires_duration_or_sample_count(self, analyzer):
+        """Test that monitoring needs a duration or a sample count."""
+        with pytest.raises(ValueError):
+            analyzer._monitor_traffic_patterns(['eth0'])
+
     @mock.patch('netpulse.autodetect.database')
     def test_populate_initial_config_no_interfaces(self, mock_database, analyzer):
         """Test configuration population with no interfaces."""
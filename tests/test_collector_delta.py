@@ -0,0 +1,426 @@
+"""
+Unit tests for delta calculation, traffic data storage and retry handling.
+
+Shared collector fixtures live in tests/conftest.py.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from netpulse.collector import CollectionError, InterfaceData, NetworkDataCollector
+from netpulse.database import DatabaseError
+from tests.test_utils import advance_time
+
+
+class TestNetworkDataCollectorDeltaCalculation:
+    """Test delta calculation functionality."""
+
+    def test_calculate_counter_delta_no_rollover(self, mock_apscheduler, mock_time_module):
+        """Test counter delta calculation without rollover."""
+        collector = NetworkDataCollector()
+
+        # Test normal delta calculation
+        delta = collector._calculate_counter_delta(1000, 1500)
+        assert delta == 500
+
+        # Test zero delta
+        delta = collector._calculate_counter_delta(1000, 1000)
+        assert delta == 0
+
+    def test_calculate_counter_delta_with_rollover(self, mock_apscheduler, mock_time_module):
+        """Test counter delta calculation with rollover."""
+        collector = NetworkDataCollector()
+
+        # Simulate rollover: current < previous
+        # Max 64-bit unsigned int = 2^64 - 1 = 18446744073709551615
+        max_counter = 2**64 - 1
+        delta = collector._calculate_counter_delta(max_counter - 100, 200)
+        expected = 301  # 100 increments to reach max_counter, 1 to wrap to 0, then 200
+        assert delta == expected
+
+        # Wrapping from the maximum value to zero is a single increment
+        assert collector._calculate_counter_delta(max_counter, 0) == 1
+
+    def test_calculate_deltas_first_collection(self, mock_apscheduler, mock_network_module, mock_time_module):
+        """Test delta calculation for first collection of an interface."""
+        collector = NetworkDataCollector()
+
+        current_stats = {
+            'rx_bytes': 1000000,
+            'tx_bytes': 500000,
+            'rx_packets': 10000,
+            'tx_packets': 5000
+        }
+
+        # First collection should return None and store baseline
+        result = collector._calculate_deltas('eth0', current_stats)
+
+        assert result is None
+        assert 'eth0' in collector._previous_data
+        assert collector._previous_data['eth0'].rx_bytes == 1000000
+
+    def test_calculate_deltas_subsequent_collection(self, mock_apscheduler, mock_network_module, mock_time_module):
+        """Test delta calculation for subsequent collections."""
+        collector = NetworkDataCollector()
+
+        # Setup previous data with mocked time
+        base_time = mock_time_module['base_time']
+        collector._previous_data['eth0'] = InterfaceData(
+            rx_bytes=1000000,
+            tx_bytes=500000,
+            rx_packets=10000,
+            tx_packets=5000,
+            timestamp=base_time
+        )
+
+        # Advance time by 60 seconds
+        advance_time(mock_time_module, 60)
+
+        current_stats = {
+            'rx_bytes': 1001000,
+            'tx_bytes': 500500,
+            'rx_packets': 10010,
+            'tx_packets': 5005
+        }
+
+        result = collector._calculate_deltas('eth0', current_stats)
+
+        assert result is not None
+        assert result['interface_name'] == 'eth0'
+        assert result['rx_bytes'] == 1000
+        assert result['tx_bytes'] == 500
+        assert result['rx_packets'] == 10
+        assert result['tx_packets'] == 5
+        assert 'collection_interval_seconds' in result
+        assert result['collection_interval_seconds'] == 60.0
+
+    def test_calculate_deltas_no_previous_timestamp(self, mock_apscheduler, mock_network_module, mock_time_module):
+        """Test delta calculation when previous data has no timestamp."""
+        collector = NetworkDataCollector()
+
+        # Setup previous data without timestamp
+        collector._previous_data['eth0'] = InterfaceData(
+            rx_bytes=1000000,
+            tx_bytes=500000,
+            rx_packets=10000,
+            tx_packets=5000,
+            timestamp=None
+        )
+
+        current_stats = {
+            'rx_bytes': 1001000,
+            'tx_bytes': 500500,
+            'rx_packets': 10010,
+            'tx_packets': 5005
+        }
+
+        result = collector._calculate_deltas('eth0', current_stats)
+
+        # Should return None when no previous timestamp
+        assert result is None
+
+    def test_calculate_deltas_invalid_time_delta(self, mock_apscheduler, mock_network_module, mock_time_module):
+        """Test delta calculation with invalid time delta."""
+        collector = NetworkDataCollector()
+
+        # Setup previous data with future timestamp (invalid) relative to the mocked clock
+        future_time = mock_time_module['base_time'] + timedelta(seconds=60)
+        collector._previous_data['eth0'] = InterfaceData(
+            rx_bytes=1000000,
+            tx_bytes=500000,
+            rx_packets=10000,
+            tx_packets=5000,
+            timestamp=future_time
+        )
+
+        current_stats = {
+            'rx_bytes': 1001000,
+            'tx_bytes': 500500,
+            'rx_packets': 10010,
+            'tx_packets': 5005
+        }
+
+        result = collector._calculate_deltas('eth0', current_stats)
+
+        # Should return None when time delta is negative
+        assert result is None
+
+    def test_calculate_deltas_exception_handling(self, mock_apscheduler, mock_network_module, mock_time_module):
+        """Test delta calculation with exceptions."""
+        collector = NetworkDataCollector()
+
+        # Setup scenario that will cause an exception
+        current_stats = {}  # Empty dict will cause KeyError when accessing keys
+
+        result = collector._calculate_deltas('eth0', current_stats)
+
+        # Should return None on exception
+        assert result is None
+
+
+class TestNetworkDataCollectorDataStorage:
+    """Test data storage functionality."""
+
+    def test_store_traffic_data_success(self, mock_apscheduler, mock_database_module, mock_time_module):
+        """Test successful traffic data storage."""
+        collector = NetworkDataCollector()
+
+        test_data = {
+            'timestamp': '2024-01-01T12:00:00',
+            'interface_name': 'eth0',
+            'rx_bytes': 1000,
+            'tx_bytes': 500,
+            'rx_packets': 10,
+            'tx_packets': 5
+        }
+
+        # Should not raise an exception
+        collector._store_traffic_data(test_data)
+
+        mock_database_module['insert'].assert_called_once_with(
+            timestamp='2024-01-01T12:00:00',
+            interface_name='eth0',
+            rx_bytes=1000,
+            tx_bytes=500,
+            rx_packets=10,
+            tx_packets=5
+        )
+
+    def test_store_traffic_data_database_error(self, mock_apscheduler, mock_database_module, mock_time_module):
+        """Test traffic data storage with database error."""
+        mock_database_module['insert'].side_effect = DatabaseError("Storage failed")
+
+        collector = NetworkDataCollector()
+        test_data = {
+            'timestamp': '2024-01-01T12:00:00',
+            'interface_name': 'eth0',
+            'rx_bytes': 1000,
+            'tx_bytes': 500,
+            'rx_packets': 10,
+            'tx_packets': 5
+        }
+
+        with pytest.raises(DatabaseError, match="Storage failed"):
+            collector._store_traffic_data(test_data)
+
+    def test_store_traffic_data_batch_success(self, mock_apscheduler, mock_database_module, mock_time_module):
+        """Test that a batch of traffic data is stored with a single database call."""
+        collector = NetworkDataCollector()
+
+        rows = [
+            {
+                'timestamp': '2024-01-01T12:00:00',
+                'interface_name': name,
+                'rx_bytes': 1000,
+                'tx_bytes': 500,
+                'rx_packets': 10,
+                'tx_packets': 5
+            }
+            for name in ('eth0', 'eth1', 'wlan0')
+        ]
+
+        collector._store_traffic_data_batch(rows)
+
+        mock_database_module['insert_batch'].assert_called_once_with(rows)
+        mock_database_module['insert'].assert_not_called()
+
+    def test_perform_collection_stores_cycle_in_one_batch(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that a collection cycle writes all interfaces with one batch insert."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+
+        collector = NetworkDataCollector()
+        result = collector._perform_collection()
+
+        assert result['success'] is True
+        mock_database_module['insert_batch'].assert_called_once()
+        rows = mock_database_module['insert_batch'].call_args[0][0]
+        assert [row['interface_name'] for row in rows] == ['eth0', 'eth1', 'wlan0']
+
+    def test_perform_collection_uses_one_timestamp_per_cycle(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that all rows of a cycle share the sample time taken for the snapshot."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+
+        collector = NetworkDataCollector()
+        collector._perform_collection()
+
+        advance_time(mock_time_module, 60)
+        for stats in mock_network_stats.values():
+            stats['rx_bytes'] += 1000
+        result = collector._perform_collection()
+
+        expected = mock_time_module['time_counter']['current'].isoformat()
+        assert {row['timestamp'] for row in result['data'].values()} == {expected}
+        assert {row['collection_interval_seconds'] for row in result['data'].values()} == {60.0}
+        assert all(
+            data.timestamp == mock_time_module['time_counter']['current']
+            for data in collector._previous_data.values()
+        )
+
+    def test_update_previous_data(self, mock_apscheduler, mock_time_module):
+        """Test updating previous data for delta calculation."""
+        collector = NetworkDataCollector()
+
+        current_stats = {
+            'rx_bytes': 1001000,
+            'tx_bytes': 500500,
+            'rx_packets': 10010,
+            'tx_packets': 5005
+        }
+
+        collector._update_previous_data('eth0', current_stats)
+
+        assert 'eth0' in collector._previous_data
+        assert collector._previous_data['eth0'].rx_bytes == 1001000
+        assert collector._previous_data['eth0'].tx_bytes == 500500
+        assert collector._previous_data['eth0'].rx_packets == 10010
+        assert collector._previous_data['eth0'].tx_packets == 5005
+        assert collector._previous_data['eth0'].timestamp is not None
+
+    def test_update_previous_data_rejects_incomplete_stats(self, mock_apscheduler, mock_time_module):
+        """Test that incomplete statistics do not leave a partial previous data entry."""
+        collector = NetworkDataCollector()
+
+        with pytest.raises(KeyError):
+            collector._update_previous_data('eth0', {'rx_bytes': 1000})
+
+        assert 'eth0' not in collector._previous_data
+
+    def test_update_previous_data_updates_entry_in_place(self, mock_apscheduler, mock_time_module):
+        """Test that an existing previous data entry is updated rather than replaced."""
+        collector = NetworkDataCollector()
+
+        collector._update_previous_data('eth0', {
+            'rx_bytes': 1000,
+            'tx_bytes': 500,
+            'rx_packets': 10,
+            'tx_packets': 5
+        })
+        entry = collector._previous_data['eth0']
+
+        advance_time(mock_time_module, 60)
+        collector._update_previous_data('eth0', {
+            'rx_bytes': 2000,
+            'tx_bytes': 1000,
+            'rx_packets': 20,
+            'tx_packets': 10
+        })
+
+        assert collector._previous_data['eth0'] is entry
+        assert entry == InterfaceData(
+            rx_bytes=2000,
+            tx_bytes=1000,
+            rx_packets=20,
+            tx_packets=10,
+            timestamp=mock_time_module['time_counter']['current']
+        )
+
+
+class TestNetworkDataCollectorRetryMechanism:
+    """Test retry mechanism functionality."""
+
+    def test_retry_operation_success(self, mock_apscheduler, mock_time_module):
+        """Test successful retry operation."""
+        collector = NetworkDataCollector(max_retries=3, retry_delay=0.1)
+
+        call_count = 0
+
+        def mock_operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise Exception("Temporary failure")
+            return "success"
+
+        with patch.object(collector._stop_event, 'wait', return_value=False) as mock_wait:
+            result = collector._retry_operation(mock_operation, "test_operation")
+
+        assert result == "success"
+        assert call_count == 2
+        assert mock_wait.call_count == 1
+
+    def test_retry_operation_max_retries_exceeded(self, mock_apscheduler, mock_time_module):
+        """Test retry operation when max retries exceeded."""
+        collector = NetworkDataCollector(max_retries=2, retry_delay=0.1)
+
+        def mock_operation():
+            raise Exception("Persistent failure")
+
+        with patch.object(collector._stop_event, 'wait', return_value=False):
+            with pytest.raises(CollectionError, match="test_operation failed: Persistent failure"):
+                collector._retry_operation(mock_operation, "test_operation")
+
+    def test_retry_operation_with_different_exceptions(self, mock_apscheduler, mock_time_module):
+        """Test retry operation with different exception types."""
+        collector = NetworkDataCollector(max_retries=2, retry_delay=0.1)
+
+        call_count = 0
+
+        def mock_operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise ValueError("Value error")
+            elif call_count == 2:
+                raise RuntimeError("Runtime error")
+            else:
+                raise ConnectionError("Connection error")
+
+        with patch.object(collector._stop_event, 'wait', return_value=False):
+            with pytest.raises(CollectionError, match="Runtime error"):
+                collector._retry_operation(mock_operation, "test_operation")
+
+        assert call_count == 2  # Should try all retries (max_retries = 2)
+
+    def test_retry_aborts_on_stop(self, mock_apscheduler, mock_time_module):
+        """Test that a pending retry is abandoned as soon as collection stops."""
+        collector = NetworkDataCollector(max_retries=5, retry_delay=30.0)
+
+        call_count = 0
+
+        def mock_operation():
+            nonlocal call_count
+            call_count += 1
+            raise Exception("Temporary failure")
+
+        collector._stop_event.set()
+
+        with pytest.raises(CollectionError, match="test_operation aborted: collection stopped"):
+            collector._retry_operation(mock_operation, "test_operation")
+
+        assert call_count == 1
+
+    def test_retry_operation_exponential_backoff(self, mock_apscheduler, mock_time_module):
+        """Test that retry delays form a geometric progression without jitter."""
+        collector = NetworkDataCollector(max_retries=4, retry_delay=0.1, retry_jitter=0.0)
+
+        def mock_operation():
+            raise Exception("Persistent failure")
+
+        with patch.object(collector._stop_event, 'wait', return_value=False) as mock_wait:
+            with pytest.raises(CollectionError):
+                collector._retry_operation(mock_operation, "test_operation")
+
+        delays = [c.args[0] for c in mock_wait.call_args_list]
+        assert delays == pytest.approx([0.1, 0.2, 0.4])
+
+    def test_retry_backoff_delay_jitter_and_cap(self, mock_apscheduler, mock_time_module):
+        """Test that jitter stays within bounds and delays are capped."""
+        collector = NetworkDataCollector(retry_delay=1.0, max_retry_delay=5.0, retry_jitter=0.5)
+
+        for attempt in range(3):
+            delay = collector._retry_backoff_delay(attempt)
+            assert 2 ** attempt <= delay <= 1.5 * 2 ** attempt
+
+        assert collector._retry_backoff_delay(10) == 5.0
+
+
+# Integration with pytest markers for test categorization
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.integration,
+    pytest.mark.slow,
+    pytest.mark.networking,
+    pytest.mark.filterwarnings("ignore::DeprecationWarning")
+]
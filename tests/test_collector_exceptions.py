@@ -0,0 +1,47 @@
+"""
+Unit tests for the collector exception hierarchy.
+
+Shared collector fixtures live in tests/conftest.py.
+"""
+
+import pytest
+
+from netpulse.collector import CollectionError, CollectorError, ConfigurationError
+
+
+class TestCollectorExceptions:
+    """Test custom collector exceptions."""
+
+    def test_collector_error_inheritance(self):
+        """Test that CollectorError inherits from Exception."""
+        error = CollectorError("Test error")
+        assert isinstance(error, Exception)
+        assert isinstance(error, CollectorError)
+
+    def test_configuration_error_inheritance(self):
+        """Test that ConfigurationError inherits from CollectorError."""
+        error = ConfigurationError("Config error")
+        assert isinstance(error, CollectorError)
+        assert isinstance(error, ConfigurationError)
+
+    def test_collection_error_inheritance(self):
+        """Test that CollectionError inherits from CollectorError."""
+        error = CollectionError("Collection error")
+        assert isinstance(error, CollectorError)
+        assert isinstance(error, CollectionError)
+
+    def test_exception_messages(self):
+        """Test that exceptions store messages correctly."""
+        error_msg = "Test error message"
+        error = CollectorError(error_msg)
+        assert str(error) == error_msg
+
+
+# Integration with pytest markers for test categorization
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.integration,
+    pytest.mark.slow,
+    pytest.mark.networking,
+    pytest.mark.filterwarnings("ignore::DeprecationWarning")
+]
@@ -0,0 +1,410 @@
+"""
+Unit tests for starting and stopping the collector and for the
+scheduled background collection job.
+
+Shared collector fixtures live in tests/conftest.py.
+"""
+
+import logging
+import queue
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from netpulse.collector import CollectorError, NetworkDataCollector, shutdown_collector
+from netpulse.database import DatabaseError
+from netpulse.network import NetworkError
+
+
+class TestNetworkDataCollectorStartStop:
+    """Test NetworkDataCollector start and stop operations."""
+
+    def test_start_collection_success(self, mock_apscheduler, mock_database_module):
+        """Test successful collection start."""
+        collector = NetworkDataCollector()
+
+        collector.start_collection()
+
+        assert collector._is_running
+        assert collector._scheduler is not None
+        assert collector._stats.start_time is not None
+        mock_apscheduler['scheduler'].start.assert_called_once()
+        mock_apscheduler['scheduler'].add_job.assert_called_once()
+
+    def test_start_collection_already_running(self, mock_apscheduler, mock_database_module):
+        """Test starting collection when already running."""
+        collector = NetworkDataCollector()
+        collector.start_collection()
+
+        with pytest.raises(CollectorError, match="Collector is already running"):
+            collector.start_collection()
+
+    def test_start_collection_scheduler_failure(self, mock_apscheduler, mock_database_module):
+        """Test start collection failure due to scheduler error."""
+        mock_apscheduler['scheduler'].start.side_effect = Exception("Scheduler failed")
+
+        collector = NetworkDataCollector()
+
+        with pytest.raises(CollectorError, match="Failed to start collection"):
+            collector.start_collection()
+
+        assert not collector._is_running
+
+    def test_stop_collection_success(self, mock_apscheduler, mock_database_module):
+        """Test successful collection stop."""
+        collector = NetworkDataCollector()
+        collector.start_collection()
+
+        collector.stop_collection()
+
+        assert not collector._is_running
+        mock_apscheduler['scheduler'].shutdown.assert_called_once_with(wait=True)
+
+    def test_stop_collection_not_running(self, mock_apscheduler, mock_database_module):
+        """Test stopping collection when not running."""
+        collector = NetworkDataCollector()
+
+        # Should not raise an error
+        collector.stop_collection()
+
+        assert not collector._is_running
+
+    def test_stop_collection_scheduler_error(self, mock_apscheduler, mock_database_module):
+        """Test stop collection with scheduler error."""
+        mock_apscheduler['scheduler'].shutdown.side_effect = Exception("Shutdown failed")
+
+        collector = NetworkDataCollector()
+        collector.start_collection()
+
+        # Should not raise an error, but should set _is_running to False
+        collector.stop_collection()
+
+        assert not collector._is_running
+
+    def test_stop_collection_lets_running_job_finish(self, mock_apscheduler, mock_database_module):
+        """Test that stopping does not deadlock with a job that is still recording its cycle."""
+        collector = NetworkDataCollector()
+        collector.start_collection()
+
+        job_finished = []
+
+        def shutdown(wait):
+            # The in-flight job needs the collector lock to record its cycle
+            job = threading.Thread(target=collector._record_poll, args=(0,))
+            job.start()
+            job.join(timeout=2)
+            job_finished.append(not job.is_alive())
+
+        mock_apscheduler['scheduler'].shutdown.side_effect = shutdown
+
+        collector.stop_collection()
+
+        assert job_finished == [True]
+        assert not collector._is_running
+        assert collector._stats.total_polls == 1
+
+    def test_can_start_follows_lifecycle(self, mock_apscheduler, mock_database_module):
+        """Test that the collector reports whether it can be started."""
+        collector = NetworkDataCollector()
+        assert collector.can_start() is True
+
+        collector.start_collection()
+        assert collector.can_start() is False
+
+        collector.stop_collection()
+        assert collector.can_start() is True
+
+    def test_collection_job_scheduling(self, mock_apscheduler, mock_database_module):
+        """Test that collection job is properly scheduled."""
+        collector = NetworkDataCollector(polling_interval=60)
+
+        collector.start_collection()
+
+        # Verify job was added with correct parameters
+        call_args = mock_apscheduler['scheduler'].add_job.call_args
+        assert call_args[1]['func'] == collector._collection_job
+        # Note: trigger.seconds is a mock, not the actual value, so we can't assert exact value
+        # assert call_args[1]['trigger'].seconds == 60
+        assert call_args[1]['id'] == 'network_collection'
+        assert call_args[1]['name'] == 'Network Data Collection'
+        assert call_args[1]['replace_existing'] is True
+
+
+class TestNetworkDataCollectorBackgroundCollection:
+    """Test background collection job functionality."""
+
+    def test_collection_job_success(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module):
+        """Test successful background collection job."""
+        # Skip this test - APScheduler timing issues make it difficult to test reliably
+        pytest.skip("APScheduler timing test is too complex to maintain reliably")
+
+    def test_collection_job_failure(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module):
+        """Test background collection job with failure."""
+        mock_network_module['get_all'].side_effect = NetworkError("Collection failed")
+
+        collector = NetworkDataCollector()
+        collector.start_collection()
+
+        # Simulate collection job execution
+        collector._collection_job()
+
+        # Verify statistics were updated for failure
+        assert collector._stats.total_polls == 1
+        assert collector._stats.successful_polls == 0
+        assert collector._stats.failed_polls == 1
+        assert collector._stats.consecutive_failures == 1
+        assert collector._stats.total_errors == 1
+
+    def test_collection_job_exception(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module):
+        """Test background collection job with unexpected exception."""
+        mock_network_module['get_all'].side_effect = Exception("Unexpected error")
+
+        collector = NetworkDataCollector()
+        collector.start_collection()
+
+        # Simulate collection job execution
+        collector._collection_job()
+
+        # Verify statistics were updated for exception
+        assert collector._stats.total_polls == 1
+        assert collector._stats.successful_polls == 0
+        assert collector._stats.failed_polls == 1
+        assert collector._stats.consecutive_failures == 1
+        assert collector._stats.total_errors == 1
+
+    def test_collection_job_counts_each_cycle_once(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that a scheduled cycle updates the statistics exactly once."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+
+        collector = NetworkDataCollector()
+        collector._collection_job()
+        collector._collection_job()
+
+        assert collector._stats.total_polls == 2
+        assert collector._stats.successful_polls == 2
+        assert collector._stats.failed_polls == 0
+        assert collector._stats.interfaces_monitored == 3
+
+    def test_recorded_poll_signals_waiters(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module):
+        """Test that every recorded cycle sets the poll-completed event."""
+        collector = NetworkDataCollector()
+        assert not collector._poll_completed_event.is_set()
+
+        collector._collection_job()
+        assert collector._poll_completed_event.is_set()
+
+        # Failed cycles are recorded too
+        collector._poll_completed_event.clear()
+        mock_network_module['get_all'].side_effect = NetworkError("Network unavailable")
+        collector._perform_collection()
+        assert collector._poll_completed_event.is_set()
+
+    def test_collection_job_records_cycle_duration(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, caplog):
+        """Test that the job measures its duration and only warns on overrun."""
+        collector = NetworkDataCollector(polling_interval=1)
+
+        with patch('netpulse.collector.time.monotonic', side_effect=[100.0, 100.3]):
+            with caplog.at_level(logging.WARNING, logger='netpulse.collector'):
+                collector._collection_job()
+
+        assert collector._last_cycle_duration == pytest.approx(0.3)
+        assert 'longer than the 1s polling interval' not in caplog.text
+
+        # The overrunning cycle is followed straight away by a catch-up cycle
+        with patch('netpulse.collector.time.monotonic', side_effect=[200.0, 201.5, 201.5, 201.8]):
+            with caplog.at_level(logging.WARNING, logger='netpulse.collector'):
+                collector._collection_job()
+
+        assert collector._last_cycle_duration == pytest.approx(0.3)
+        assert 'Collection cycle took 1.50s, longer than the 1s polling interval' in caplog.text
+
+    def test_collection_job_catches_up_after_overrun(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module):
+        """Test that an overrunning cycle is followed immediately by the next one."""
+        collector = NetworkDataCollector(polling_interval=1)
+
+        # Two 1.5s cycles, then one that fits in the interval
+        with patch('netpulse.collector.time.monotonic', side_effect=[0.0, 1.5, 1.5, 3.0, 3.0, 3.2]):
+            collector._collection_job()
+
+        assert mock_network_module['get_all'].call_count == 3
+        assert collector._stats.total_polls == 3
+
+    def test_collection_job_no_catch_up_after_failure_or_stop(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module):
+        """Test that overrunning cycles are not repeated when they fail or collection stops."""
+        collector = NetworkDataCollector(polling_interval=1)
+
+        mock_network_module['get_all'].side_effect = NetworkError("Network unavailable")
+        with patch('netpulse.collector.time.monotonic', side_effect=[0.0, 1.5]):
+            collector._collection_job()
+        assert mock_network_module['get_all'].call_count == 1
+
+        mock_network_module['get_all'].side_effect = None
+        collector._stop_event.set()
+        with patch('netpulse.collector.time.monotonic', side_effect=[10.0, 11.5]):
+            collector._collection_job()
+        assert mock_network_module['get_all'].call_count == 2
+
+    def test_background_writer_flushes_on_stop(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that rows queued while running are written before stop returns."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+
+        collector = NetworkDataCollector()
+        collector.start_collection()
+
+        result = collector._perform_collection(background_write=True)
+        assert result['success'] is True
+        assert len(result['data']) == 3
+
+        collector.stop_collection()
+
+        assert collector._write_queue is None
+        assert collector._writer_thread is None
+        written = [
+            row['interface_name']
+            for call in mock_database_module['insert_batch'].call_args_list
+            for row in call.args[0]
+        ]
+        assert sorted(written) == ['eth0', 'eth1', 'wlan0']
+
+        # The writer records the cycle once its rows are stored
+        stats = collector.get_collection_stats()
+        assert stats['total_polls'] == 1
+        assert stats['successful_polls'] == 1
+        assert stats['last_successful_poll'] is not None
+
+    def test_background_writer_failure_counts_as_failed_poll(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that rows the background writer fails to store show up as a failed poll."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+        mock_database_module['insert_batch'].side_effect = DatabaseError("Database error")
+
+        collector = NetworkDataCollector(max_retries=1)
+        collector.start_collection()
+
+        result = collector._perform_collection(background_write=True)
+        assert result['success'] is True
+
+        collector.stop_collection()
+
+        stats = collector.get_collection_stats()
+        assert stats['total_polls'] == 1
+        assert stats['successful_polls'] == 0
+        assert stats['failed_polls'] == 1
+        assert stats['consecutive_failures'] == 1
+        assert stats['last_successful_poll'] is None
+        assert stats['total_errors'] == 3
+        assert stats['dropped_writes'] == 3
+
+    def test_background_writer_retries_failed_write(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that the background writer retries a write that fails once."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+        mock_database_module['insert_batch'].side_effect = [DatabaseError("Database is locked"), 3]
+
+        collector = NetworkDataCollector(retry_delay=0.01)
+        collector.start_collection()
+        collector._perform_collection(background_write=True)
+
+        assert collector._poll_completed_event.wait(timeout=5)
+        collector.stop_collection()
+
+        assert mock_database_module['insert_batch'].call_count == 2
+        stats = collector.get_collection_stats()
+        assert stats['successful_polls'] == 1
+        assert stats['dropped_writes'] == 0
+
+    def test_stop_collection_ends_writer_retry_wait(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that stopping does not wait out the backoff of a failing write."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+        first_attempt = threading.Event()
+
+        def failing_insert(rows):
+            first_attempt.set()
+            raise DatabaseError("Database is locked")
+
+        mock_database_module['insert_batch'].side_effect = failing_insert
+
+        collector = NetworkDataCollector(retry_delay=30.0)
+        collector.start_collection()
+        collector._perform_collection(background_write=True)
+        assert first_attempt.wait(timeout=5)
+
+        start = time.monotonic()
+        collector.stop_collection()
+
+        assert time.monotonic() - start < 5
+        assert mock_database_module['insert_batch'].call_count == 1
+        assert collector.get_collection_stats()['failed_polls'] == 1
+
+    def test_collect_once_stores_synchronously_while_running(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that a manual collection stores its rows before returning, even while running."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+        mock_database_module['insert_batch'].side_effect = DatabaseError("Database error")
+
+        collector = NetworkDataCollector()
+        collector.start_collection()
+        try:
+            result = collector.collect_once()
+
+            # The storage failure is reported by the call itself
+            assert len(result['errors']) == 3
+            assert collector._write_queue.empty()
+            assert collector._previous_data == {}
+            assert collector.get_collection_stats()['failed_polls'] == 1
+        finally:
+            collector.stop_collection()
+
+    def test_shutdown_collector_flushes_running_collector(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats, monkeypatch):
+        """Test that shutdown_collector stops the global collector and stores queued rows."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+
+        collector = NetworkDataCollector()
+        monkeypatch.setattr('netpulse.collector._collector_instance', collector)
+        collector.start_collection()
+        collector._perform_collection(background_write=True)
+
+        shutdown_collector()
+
+        assert collector.can_start() is True
+        mock_database_module['insert_batch'].assert_called_once()
+
+    def test_shutdown_collector_without_collector(self, monkeypatch):
+        """Test that shutdown_collector does nothing when no collector was created."""
+        monkeypatch.setattr('netpulse.collector._collector_instance', None)
+
+        # Should not raise an error
+        shutdown_collector()
+
+    def test_background_writer_drops_cycle_when_queue_full(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module, mock_network_stats):
+        """Test that a full write queue drops the cycle instead of blocking collection."""
+        mock_network_module['get_all'].return_value = mock_network_stats
+
+        collector = NetworkDataCollector()
+        collector._write_queue = queue.Queue(maxsize=1)
+        collector._write_queue.put_nowait(None)
+
+        result = collector._perform_collection(background_write=True)
+
+        assert result['success'] is False
+        assert len(result['errors']) == 3
+        assert collector._write_queue.qsize() == 1
+        assert collector._previous_data == {}
+        stats = collector.get_collection_stats()
+        assert stats['dropped_writes'] == 3
+        assert stats['failed_polls'] == 1
+        mock_database_module['insert_batch'].assert_not_called()
+
+    def test_collection_job_multiple_cycles(self, mock_apscheduler, mock_network_module, mock_database_module, mock_time_module):
+        """Test multiple collection job cycles."""
+        # Skip this test - APScheduler timing issues make it difficult to test reliably
+        pytest.skip("Multiple cycle APScheduler timing test is too complex to maintain reliably")
+
+
+# Integration with pytest markers for test categorization
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.integration,
+    pytest.mark.slow,
+    pytest.mark.networking,
+    pytest.mark.filterwarnings("ignore::DeprecationWarning")
+]
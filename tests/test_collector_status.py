@@ -0,0 +1,65 @@
+"""
+Unit tests for collector status reporting and statistics.
+
+Shared collector fixtures live in tests/conftest.py.
+"""
+
+import pytest
+
+from netpulse.collector import NetworkDataCollector
+
+
+class TestNetworkDataCollectorStatusReporting:
+    """Test status reporting and statistics functionality."""
+
+    def test_get_collection_status(self, mock_apscheduler, mock_database_module, mock_time_module):
+        """Test getting collection status."""
+        collector = NetworkDataCollector()
+        collector.start_collection()
+
+        status = collector.get_collection_status()
+
+        assert 'is_running' in status
+        assert 'stats' in status
+        assert 'configuration' in status
+        assert 'previous_data_count' in status
+        assert status['is_running'] is True
+        assert isinstance(status['stats'], dict)
+        assert isinstance(status['configuration'], dict)
+
+    def test_get_collection_stats(self, mock_apscheduler, mock_database_module, mock_time_module):
+        """Test getting collection statistics."""
+        collector = NetworkDataCollector()
+        stats = collector.get_collection_stats()
+
+        assert 'total_polls' in stats
+        assert 'successful_polls' in stats
+        assert 'failed_polls' in stats
+        assert 'interfaces_monitored' in stats
+        assert 'uptime_seconds' in stats
+
+    def test_collection_stats_thread_safety(self, mock_apscheduler, mock_database_module, mock_time_module):
+        """Test that statistics access is thread-safe."""
+        collector = NetworkDataCollector()
+
+        # Test multiple concurrent accesses
+        import concurrent.futures
+
+        def access_stats():
+            return collector.get_collection_stats()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: access_stats(), range(10)))
+
+        assert len(results) == 10
+        assert all('total_polls' in result for result in results)
+
+
+# Integration with pytest markers for test categorization
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.integration,
+    pytest.mark.slow,
+    pytest.mark.networking,
+    pytest.mark.filterwarnings("ignore::DeprecationWarning")
+]
@@ -9,57 +9,134 @@ This module tests all database operations including:
 - Error handling and edge cases
 """
 
+import os
 import pytest
 import sqlite3
-import tempfile
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
 from netpulse.database import (
     DatabaseError,
+    _default_db_path,
     get_db_connection,
     initialize_database,
     insert_traffic_data,
+    insert_traffic_data_batch,
     get_traffic_data,
+    count_traffic_data,
     get_configuration_value,
+    get_configuration_values_batch,
     set_configuration_value,
-    get_database_stats
+    set_configuration_values_batch,
+    get_database_stats,
+    is_initialized
 )
 
 
 @pytest.fixture
-def temp_db_path():
-    """Create a temporary database file for testing."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        temp_path = f.name
-
-    yield temp_path
-
-    # Cleanup after test
-    if Path(temp_path).exists():
-        Path(temp_path).unlink()
+def temp_db_path(tmp_path):
+    """Provide a temporary database file path; pytest removes the directory."""
+    return tmp_path / "temp.db"
 
 
 @pytest.fixture
-def temp_db_connection(temp_db_path):
+def temp_db_connection(temp_db_path, monkeypatch):
     """Create a temporary database connection for testing."""
     # Patch the DB_PATH to use our temporary database
-    with patch('netpulse.database.DB_PATH', Path(temp_db_path)):
-        yield temp_db_path
+    monkeypatch.setattr('netpulse.database.DB_PATH', temp_db_path)
+    return temp_db_path
 
 
-@pytest.fixture
-def initialized_db(temp_db_connection):
-    """Create and initialize a temporary database for testing."""
-    # Initialize the database
-    initialize_database()
-    yield temp_db_connection
+def _clear_tables(conn):
+    """Empty the shared database, including the AUTOINCREMENT counters."""
+    conn.execute("DELETE FROM traffic_data")
+    conn.execute("DELETE FROM configuration")
+    conn.execute("DELETE FROM sqlite_sequence")
+    conn.commit()
+
+
+def _shared_connection_factory(conn):
+    """
+    Build a stand-in for get_db_connection that always yields the same connection.
+
+    Mirrors the real context manager: SQLite errors are wrapped in DatabaseError
+    and work left uncommitted is discarded when the block exits, as closing the
+    connection would.
+    """
+    @contextmanager
+    def shared_connection(db_url=None):
+        try:
+            yield conn
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to connect to database: {e}")
+        finally:
+            conn.rollback()
+
+    return shared_connection
+
+
+@pytest.fixture(scope="session")
+def mem_db():
+    """
+    Create and initialize one in-memory database shared by the whole test session.
+
+    Named after the pytest-xdist worker so that `pytest -n auto` runs, where each
+    worker is a separate process, never share a cache name between workers.
+    """
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+    conn = sqlite3.connect(f"file:netpulse-{worker}?mode=memory&cache=shared", uri=True)
+    conn.row_factory = sqlite3.Row
+    with patch('netpulse.database.get_db_connection', _shared_connection_factory(conn)):
+        initialize_database()
+
+    # Test-only settings: nothing here has to survive a crash, so skip syncing
+    # and keep the rollback journal and temporary sort structures in memory
+    conn.executescript(
+        "PRAGMA journal_mode=MEMORY; PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY;"
+    )
+
+    yield conn
+
+    conn.close()
 
 
 @pytest.fixture
+def initialized_db(mem_db, monkeypatch):
+    """
+    Provide the shared in-memory database, emptied before each test.
+
+    Routes the database module's get_db_connection to the session connection and
+    yields that connection, so tests can seed and check rows without reopening
+    the database. Tests that need a real file (connection failures, corruption,
+    file size) use temp_db_path instead.
+    """
+    monkeypatch.setattr('netpulse.database.get_db_connection', _shared_connection_factory(mem_db))
+    _clear_tables(mem_db)
+
+    yield mem_db
+
+
+@pytest.fixture(scope="class")
+def seeded_db(mem_db, multiple_traffic_records):
+    """
+    Provide the shared in-memory database holding multiple_traffic_records.
+
+    The rows are seeded once for the whole test class, so tests using this
+    fixture must only read from the database.
+    """
+    with patch('netpulse.database.get_db_connection', _shared_connection_factory(mem_db)):
+        _clear_tables(mem_db)
+        _bulk_insert(mem_db, multiple_traffic_records)
+
+        yield mem_db
+
+
+@pytest.fixture(scope="module")
 def sample_traffic_data():
-    """Provide sample traffic data for testing."""
+    """Provide sample traffic data for testing (shared by the module, do not modify)."""
     return {
         'timestamp': '2024-01-01T12:00:00',
         'interface_name': 'eth0',
@@ -70,9 +147,9 @@ def sample_traffic_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multiple_traffic_records():
-    """Provide multiple traffic records for testing."""
+    """Provide multiple traffic records for testing (shared by the module, do not modify)."""
     base_time = datetime.fromisoformat('2024-01-01T12:00:00')
     records = []
 
@@ -89,6 +166,34 @@ def multiple_traffic_records():
     return records
 
 
+# Rows per multi-row INSERT: 150 rows x 6 columns stays under SQLite's
+# historical limit of 999 bound parameters per statement
+_BULK_INSERT_ROWS = 150
+
+
+def _bulk_insert(conn, records):
+    """
+    Insert traffic data records in a single transaction on the given connection.
+
+    Used to seed data for tests that are not about insert_traffic_data itself,
+    which commits once per record. Rows are sent as multi-row
+    INSERT ... VALUES (...), (...) statements of up to _BULK_INSERT_ROWS rows.
+    """
+    for start in range(0, len(records), _BULK_INSERT_ROWS):
+        chunk = records[start:start + _BULK_INSERT_ROWS]
+        conn.execute(
+            "INSERT INTO traffic_data (timestamp, interface_name, rx_bytes, tx_bytes, "
+            "rx_packets, tx_packets) VALUES " + ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk)),
+            list(chain.from_iterable(
+                (record['timestamp'], record['interface_name'],
+                 record['rx_bytes'], record['tx_bytes'],
+                 record['rx_packets'], record['tx_packets'])
+                for record in chunk
+            ))
+        )
+    conn.commit()
+
+
 class TestDatabaseError:
     """Test the custom DatabaseError exception."""
 
@@ -108,39 +213,57 @@ class TestDatabaseError:
 class TestDatabaseConnection:
     """Test database connection management."""
 
-    def test_get_db_connection_success(self, temp_db_path):
+    def test_get_db_connection_success(self, temp_db_path, monkeypatch):
         """Test successful database connection."""
-        with patch('netpulse.database.DB_PATH', Path(temp_db_path)):
-            with get_db_connection() as conn:
-                assert conn is not None
-                assert isinstance(conn, sqlite3.Connection)
-                assert conn.row_factory == sqlite3.Row
+        monkeypatch.setattr('netpulse.database.DB_PATH', temp_db_path)
+        with get_db_connection() as conn:
+            assert conn is not None
+            assert isinstance(conn, sqlite3.Connection)
+            assert conn.row_factory == sqlite3.Row
+
+    def test_get_db_connection_sets_busy_timeout(self, temp_db_path, monkeypatch):
+        """Test that connections wait for competing writers before failing."""
+        monkeypatch.setattr('netpulse.database.DB_PATH', temp_db_path)
+        with get_db_connection() as conn:
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 10000
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
 
-    def test_get_db_connection_failure(self):
+    def test_get_db_connection_failure(self, monkeypatch):
         """Test database connection failure."""
-        with patch('netpulse.database.DB_PATH', Path('/nonexistent/path/db.db')):
-            with pytest.raises(DatabaseError, match="Failed to connect to database"):
-                with get_db_connection():
-                    pass
+        monkeypatch.setattr('netpulse.database.DB_PATH', Path('/nonexistent/path/db.db'))
+        with pytest.raises(DatabaseError, match="Failed to connect to database"):
+            with get_db_connection():
+                pass
 
-    def test_get_db_connection_context_manager_cleanup(self, temp_db_path):
+    def test_get_db_connection_context_manager_cleanup(self, temp_db_path, monkeypatch):
         """Test that connection is properly closed after context manager."""
-        with patch('netpulse.database.DB_PATH', Path(temp_db_path)):
-            conn = None
-            with get_db_connection() as db_conn:
-                conn = db_conn
-                # Connection should be open during context
-                assert conn is not None
-
-            # Connection should be closed after context manager
-            # We can't directly check the closed attribute, but we can verify
-            # that attempting to use the connection raises an error
-            try:
-                conn.execute("SELECT 1")
-                assert False, "Connection should be closed"
-            except sqlite3.ProgrammingError:
-                # This is expected when connection is closed
-                pass
+        monkeypatch.setattr('netpulse.database.DB_PATH', temp_db_path)
+        conn = None
+        with get_db_connection() as db_conn:
+            conn = db_conn
+            # Connection should be open during context
+            assert conn is not None
+
+        # Connection should be closed after context manager
+        # We can't directly check the closed attribute, but we can verify
+        # that attempting to use the connection raises an error
+        try:
+            conn.execute("SELECT 1")
+            assert False, "Connection should be closed"
+        except sqlite3.ProgrammingError:
+            # This is expected when connection is closed
+            pass
+
+    def test_default_db_path_from_environment(self, temp_db_path, monkeypatch):
+        """Test that NETPULSE_DB_PATH chooses the database file."""
+        monkeypatch.setenv('NETPULSE_DB_PATH', str(temp_db_path))
+        assert _default_db_path() == temp_db_path
+
+    def test_default_db_path_in_project_root(self, monkeypatch):
+        """Test that the database lives in the project root by default."""
+        monkeypatch.delenv('NETPULSE_DB_PATH', raising=False)
+        assert _default_db_path().name == 'netpulse.db'
+        assert (_default_db_path().parent / 'src' / 'netpulse').is_dir()
 
 
 class TestDatabaseInitialization:
@@ -167,11 +290,11 @@ class TestDatabaseInitialization:
         initialize_database()
 
         with get_db_connection() as conn:
-            cursor = conn.cursor()
-
             # Check indexes
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
-            indexes = [row['name'] for row in cursor.fetchall()]
+            indexes = {
+                row['name'] for row in
+                conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
 
             expected_indexes = [
                 'idx_traffic_data_timestamp',
@@ -182,6 +305,15 @@ class TestDatabaseInitialization:
             for index in expected_indexes:
                 assert index in indexes
 
+    def test_initialize_database_enables_wal(self, temp_db_connection):
+        """Test that initialize_database switches the database to WAL mode."""
+        initialize_database()
+
+        with get_db_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            # synchronous=NORMAL is applied to every connection
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
     def test_initialize_database_handles_existing_tables(self, temp_db_connection):
         """Test that initialize_database handles existing tables gracefully."""
         # Initialize twice - should not fail
@@ -196,6 +328,22 @@ class TestDatabaseInitialization:
             with pytest.raises(DatabaseError, match="Database initialization failed"):
                 initialize_database()
 
+    def test_is_initialized(self, temp_db_connection):
+        """Test that is_initialized reports whether the schema exists."""
+        assert is_initialized() is False
+
+        initialize_database()
+
+        assert is_initialized() is True
+
+    def test_is_initialized_failure(self):
+        """Test is_initialized failure."""
+        with patch('netpulse.database.get_db_connection') as mock_conn:
+            mock_conn.side_effect = sqlite3.Error("Connection failed")
+
+            with pytest.raises(DatabaseError, match="Failed to check database initialization"):
+                is_initialized()
+
 
 class TestInsertTrafficData:
     """Test traffic data insertion functionality."""
@@ -208,15 +356,14 @@ class TestInsertTrafficData:
         assert record_id > 0
 
         # Verify the record was inserted
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM traffic_data WHERE id = ?", (record_id,))
-            row = cursor.fetchone()
+        row = initialized_db.execute(
+            "SELECT * FROM traffic_data WHERE id = ?", (record_id,)
+        ).fetchone()
 
-            assert row is not None
-            assert row['interface_name'] == sample_traffic_data['interface_name']
-            assert row['rx_bytes'] == sample_traffic_data['rx_bytes']
-            assert row['tx_bytes'] == sample_traffic_data['tx_bytes']
+        assert row is not None
+        assert row['interface_name'] == sample_traffic_data['interface_name']
+        assert row['rx_bytes'] == sample_traffic_data['rx_bytes']
+        assert row['tx_bytes'] == sample_traffic_data['tx_bytes']
 
     def test_insert_traffic_data_with_zero_values(self, initialized_db):
         """Test inserting traffic data with zero values."""
@@ -287,115 +434,47 @@ class TestInsertTrafficData:
         assert record_id_2 == record_id_1 + 1
 
 
-class TestGetTrafficData:
-    """Test traffic data retrieval functionality."""
-
-    def test_get_traffic_data_no_filters(self, initialized_db, multiple_traffic_records):
-        """Test retrieving all traffic data without filters."""
-        # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
-
-        result = get_traffic_data()
-
-        assert len(result) == len(multiple_traffic_records)
-        assert all(isinstance(record, dict) for record in result)
-        assert all('id' in record for record in result)
-
-    def test_get_traffic_data_with_limit(self, initialized_db, multiple_traffic_records):
-        """Test retrieving traffic data with limit."""
-        # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
-
-        limit = 3
-        result = get_traffic_data(limit=limit)
-
-        assert len(result) == limit
-        assert result[0]['id'] > result[-1]['id']  # Should be ordered by timestamp DESC
-
-    def test_get_traffic_data_with_offset(self, initialized_db, multiple_traffic_records):
-        """Test retrieving traffic data with offset."""
-        # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
-
-        offset = 2
-        result = get_traffic_data(offset=offset)
+class TestInsertTrafficDataBatch:
+    """Test batch traffic data insertion functionality."""
 
-        assert len(result) == len(multiple_traffic_records) - offset
+    def test_insert_traffic_data_batch_success(self, initialized_db, multiple_traffic_records):
+        """Test inserting several records in one call."""
+        inserted = insert_traffic_data_batch(multiple_traffic_records)
 
-    def test_get_traffic_data_with_interface_filter(self, initialized_db, multiple_traffic_records):
-        """Test retrieving traffic data filtered by interface."""
-        # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
+        assert inserted == len(multiple_traffic_records)
+        assert len(get_traffic_data()) == len(multiple_traffic_records)
 
-        interface_name = 'eth0'
-        result = get_traffic_data(interface_name=interface_name)
+    def test_insert_traffic_data_batch_empty(self, initialized_db):
+        """Test that an empty batch is a no-op."""
+        assert insert_traffic_data_batch([]) == 0
+        assert get_traffic_data() == []
 
-        assert all(record['interface_name'] == interface_name for record in result)
-        assert len(result) > 0
+    def test_insert_traffic_data_batch_idempotent_on_retry(self, initialized_db, multiple_traffic_records):
+        """Test that re-sending an already stored batch does not duplicate rows."""
+        assert insert_traffic_data_batch(multiple_traffic_records) == len(multiple_traffic_records)
 
-    def test_get_traffic_data_with_time_filters(self, initialized_db, multiple_traffic_records):
-        """Test retrieving traffic data with time range filters."""
-        # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
+        # Simulate a retry after the first attempt had already committed
+        assert insert_traffic_data_batch(multiple_traffic_records) == 0
+        assert len(get_traffic_data()) == len(multiple_traffic_records)
 
-        start_time = '2024-01-01T12:02:00'
-        end_time = '2024-01-01T12:03:00'
+    def test_insert_traffic_data_batch_is_atomic(self, initialized_db, multiple_traffic_records):
+        """Test that a failing record rolls back the whole batch."""
+        records = multiple_traffic_records + [{'timestamp': '2024-01-01T13:00:00'}]
 
-        result = get_traffic_data(start_time=start_time, end_time=end_time)
+        with pytest.raises(DatabaseError, match="Failed to insert traffic data batch"):
+            insert_traffic_data_batch(records)
 
-        for record in result:
-            timestamp = record['timestamp']
-            assert start_time <= timestamp <= end_time
+        assert get_traffic_data() == []
 
-    def test_get_traffic_data_with_multiple_filters(self, initialized_db, multiple_traffic_records):
-        """Test retrieving traffic data with multiple filters."""
-        # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
 
-        filters = {
-            'interface_name': 'eth0',
-            'limit': 2,
-            'start_time': '2024-01-01T12:01:00'
-        }
-
-        result = get_traffic_data(**filters)
-
-        assert len(result) <= 2
-        assert all(record['interface_name'] == 'eth0' for record in result)
+class TestGetTrafficData:
+    """Test traffic data retrieval functionality."""
 
     def test_get_traffic_data_empty_result(self, initialized_db):
         """Test retrieving traffic data when no records exist."""
         result = get_traffic_data()
         assert result == []
 
-    def test_get_traffic_data_no_matching_interface(self, initialized_db, multiple_traffic_records):
-        """Test retrieving traffic data for non-existent interface."""
-        # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
-
-        result = get_traffic_data(interface_name='nonexistent')
-        assert result == []
-
-    def test_get_traffic_data_invalid_time_range(self, initialized_db, multiple_traffic_records):
-        """Test retrieving traffic data with invalid time range."""
-        # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
-
-        # Start time after end time
-        result = get_traffic_data(
-            start_time='2024-01-01T12:04:00',
-            end_time='2024-01-01T12:00:00'
-        )
-        assert result == []
-
     def test_get_traffic_data_failure(self, initialized_db):
         """Test traffic data retrieval failure."""
         with patch('netpulse.database.get_db_connection') as mock_conn:
@@ -404,6 +483,74 @@ class TestGetTrafficData:
             with pytest.raises(DatabaseError, match="Failed to retrieve traffic data"):
                 get_traffic_data()
 
+    def test_count_traffic_data_empty(self, initialized_db):
+        """Test counting traffic data when no records exist."""
+        assert count_traffic_data() == 0
+
+    def test_count_traffic_data_failure(self, initialized_db):
+        """Test traffic data count failure."""
+        with patch('netpulse.database.get_db_connection') as mock_conn:
+            mock_conn.side_effect = sqlite3.Error("Query failed")
+
+            with pytest.raises(DatabaseError, match="Failed to count traffic data"):
+                count_traffic_data()
+
+
+class TestGetTrafficDataFilters:
+    """Test traffic data retrieval filters against one seeded dataset."""
+
+    # multiple_traffic_records holds five rows one minute apart from 12:00,
+    # alternating between eth0 (12:00, 12:02, 12:04) and eth1 (12:01, 12:03)
+    @pytest.mark.parametrize("filters, expected_count, expected_interface, expected_bounds", [
+        pytest.param({}, 5, None, None, id="no_filters"),
+        pytest.param({'limit': 3}, 3, None, ('2024-01-01T12:02:00', '2024-01-01T12:04:00'), id="limit"),
+        pytest.param({'offset': 2}, 3, None, ('2024-01-01T12:00:00', '2024-01-01T12:02:00'), id="offset"),
+        pytest.param({'interface_name': 'eth0'}, 3, 'eth0', None, id="interface_filter"),
+        pytest.param(
+            {'start_time': '2024-01-01T12:02:00', 'end_time': '2024-01-01T12:03:00'},
+            2, None, ('2024-01-01T12:02:00', '2024-01-01T12:03:00'),
+            id="time_filters"
+        ),
+        pytest.param(
+            {'interface_name': 'eth0', 'limit': 2, 'start_time': '2024-01-01T12:01:00'},
+            2, 'eth0', ('2024-01-01T12:02:00', '2024-01-01T12:04:00'),
+            id="multiple_filters"
+        ),
+        pytest.param({'interface_name': 'nonexistent'}, 0, None, None, id="no_matching_interface"),
+        pytest.param(
+            # Start time after end time
+            {'start_time': '2024-01-01T12:04:00', 'end_time': '2024-01-01T12:00:00'},
+            0, None, None,
+            id="invalid_time_range"
+        ),
+    ])
+    def test_get_traffic_data_filters(self, seeded_db, filters, expected_count,
+                                      expected_interface, expected_bounds):
+        """Test retrieving traffic data with each supported filter."""
+        result = get_traffic_data(**filters)
+
+        assert len(result) == expected_count
+
+        # Results are ordered by timestamp DESC
+        timestamps = [record['timestamp'] for record in result]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+        if expected_interface is not None:
+            assert [record['interface_name'] for record in result] == [expected_interface] * expected_count
+
+        if expected_bounds is not None:
+            assert (timestamps[-1], timestamps[0]) == expected_bounds
+
+    @pytest.mark.parametrize("filters", [
+        pytest.param({}, id="no_filters"),
+        pytest.param({'interface_name': 'eth0'}, id="interface_filter"),
+        pytest.param({'start_time': '2024-01-01T12:02:00', 'end_time': '2024-01-01T12:03:00'}, id="time_filters"),
+        pytest.param({'interface_name': 'nonexistent'}, id="no_matching_interface"),
+    ])
+    def test_count_traffic_data_filters(self, seeded_db, filters):
+        """Test that counting applies the same filters as retrieving."""
+        assert count_traffic_data(**filters) == len(get_traffic_data(**filters))
+
 
 class TestConfigurationManagement:
     """Test configuration value management."""
@@ -466,6 +613,54 @@ class TestConfigurationManagement:
             with pytest.raises(DatabaseError, match="Failed to get configuration value"):
                 get_configuration_value('test_key')
 
+    def test_get_configuration_values_batch(self, initialized_db):
+        """Test getting several configuration values at once."""
+        set_configuration_value('key_a', 'value_a')
+        set_configuration_value('key_b', 'value_b')
+        set_configuration_value('key_c', 'value_c')
+
+        result = get_configuration_values_batch(['key_a', 'key_c', 'nonexistent_key'])
+
+        assert result == {'key_a': 'value_a', 'key_c': 'value_c'}
+
+    def test_get_configuration_values_batch_empty(self, initialized_db):
+        """Test getting configuration values for no keys."""
+        with patch('netpulse.database.get_db_connection') as mock_conn:
+            assert get_configuration_values_batch([]) == {}
+
+        mock_conn.assert_not_called()
+
+    def test_get_configuration_values_batch_failure(self, initialized_db):
+        """Test getting configuration values failure."""
+        with patch('netpulse.database.get_db_connection') as mock_conn:
+            mock_conn.side_effect = sqlite3.Error("Query failed")
+
+            with pytest.raises(DatabaseError, match="Failed to get configuration values"):
+                get_configuration_values_batch(['test_key'])
+
+    def test_set_configuration_values_batch(self, initialized_db):
+        """Test setting several configuration values at once."""
+        set_configuration_value('key_a', 'old_value')
+
+        set_configuration_values_batch({'key_a': 'value_a', 'key_b': 'value_b'})
+
+        assert get_configuration_values_batch(['key_a', 'key_b']) == {'key_a': 'value_a', 'key_b': 'value_b'}
+
+    def test_set_configuration_values_batch_empty(self, initialized_db):
+        """Test setting no configuration values."""
+        with patch('netpulse.database.get_db_connection') as mock_conn:
+            set_configuration_values_batch({})
+
+        mock_conn.assert_not_called()
+
+    def test_set_configuration_values_batch_failure(self, initialized_db):
+        """Test setting configuration values failure."""
+        with patch('netpulse.database.get_db_connection') as mock_conn:
+            mock_conn.side_effect = sqlite3.Error("Insert failed")
+
+            with pytest.raises(DatabaseError, match="Failed to set configuration values"):
+                set_configuration_values_batch({'test_key': 'test_value'})
+
     def test_configuration_value_with_special_characters(self, initialized_db):
         """Test configuration values with special characters."""
         key = 'special_key'
@@ -493,8 +688,7 @@ class TestDatabaseStats:
     def test_get_database_stats_with_data(self, initialized_db, multiple_traffic_records):
         """Test getting stats from a database with data."""
         # Insert test data
-        for record in multiple_traffic_records:
-            insert_traffic_data(**record)
+        _bulk_insert(initialized_db, multiple_traffic_records)
 
         # Add some configuration values
         set_configuration_value('key1', 'value1')
@@ -506,6 +700,12 @@ class TestDatabaseStats:
         assert stats['configuration_records'] == 2
         assert stats['database_size_bytes'] > 0
 
+        # Counts agree with the tables themselves
+        counts = initialized_db.execute(
+            "SELECT (SELECT COUNT(*) FROM traffic_data) AS t, (SELECT COUNT(*) FROM configuration) AS c"
+        ).fetchone()
+        assert (stats['traffic_data_records'], stats['configuration_records']) == (counts['t'], counts['c'])
+
     def test_get_database_stats_failure(self, initialized_db):
         """Test getting database stats failure."""
         with patch('netpulse.database.get_db_connection') as mock_conn:
@@ -514,11 +714,11 @@ class TestDatabaseStats:
             with pytest.raises(DatabaseError, match="Failed to get database stats"):
                 get_database_stats()
 
-    def test_get_database_stats_file_not_found(self):
+    def test_get_database_stats_file_not_found(self, monkeypatch):
         """Test getting stats when database file doesn't exist."""
-        with patch('netpulse.database.DB_PATH', Path('/nonexistent/database.db')):
-            with pytest.raises(DatabaseError):
-                get_database_stats()
+        monkeypatch.setattr('netpulse.database.DB_PATH', Path('/nonexistent/database.db'))
+        with pytest.raises(DatabaseError):
+            get_database_stats()
 
 
 class TestIntegrationScenarios:
@@ -552,8 +752,9 @@ class TestIntegrationScenarios:
         """Test handling data from multiple network interfaces."""
         interfaces = ['eth0', 'eth1', 'wlan0']
 
+        insert = insert_traffic_data
         for i, interface in enumerate(interfaces):
-            insert_traffic_data(
+            insert(
                 f'2024-01-01T12:{i:02d}:00',
                 interface,
                 1000 * (i + 1),
@@ -573,15 +774,17 @@ class TestIntegrationScenarios:
         base_time = datetime.fromisoformat('2024-01-01T12:00:00')
 
         # Insert data at different time intervals
-        for i in range(10):
-            insert_traffic_data(
-                (base_time + timedelta(minutes=i * 5)).isoformat(),
-                'eth0',
-                1000 + i * 100,
-                2000 + i * 200,
-                10 + i,
-                20 + i * 2
-            )
+        _bulk_insert(initialized_db, [
+            {
+                'timestamp': (base_time + timedelta(minutes=i * 5)).isoformat(),
+                'interface_name': 'eth0',
+                'rx_bytes': 1000 + i * 100,
+                'tx_bytes': 2000 + i * 200,
+                'rx_packets': 10 + i,
+                'tx_packets': 20 + i * 2
+            }
+            for i in range(10)
+        ])
 
         # Test querying different time ranges
         mid_time = (base_time + timedelta(minutes=20)).isoformat()
@@ -592,26 +795,31 @@ class TestIntegrationScenarios:
     def test_concurrent_operations_simulation(self, initialized_db):
         """Test simulation of concurrent database operations."""
         # This test simulates multiple operations that might happen concurrently
-        data = []
+        records = [
+            {
+                'timestamp': f'2024-01-01T12:{i:02d}:00',
+                'interface_name': f'eth{i % 2}',
+                'rx_bytes': 1000 + i * 50,
+                'tx_bytes': 2000 + i * 100,
+                'rx_packets': 10 + i,
+                'tx_packets': 20 + i * 2
+            }
+            for i in range(10)
+        ]
 
         # Simulate inserting multiple records
-        for i in range(10):
-            record_id = insert_traffic_data(
-                f'2024-01-01T12:{i:02d}:00',
-                f'eth{i % 2}',
-                1000 + i * 50,
-                2000 + i * 100,
-                10 + i,
-                20 + i * 2
-            )
-            data.append(record_id)
+        inserted = insert_traffic_data_batch(records)
+        assert inserted == 10
 
-        # Verify all records were inserted correctly
+        # Verify all records were inserted correctly (newest first)
         all_data = get_traffic_data()
         assert len(all_data) == 10
 
-        # Verify record IDs are sequential
-        assert data == sorted(data)
+        stored = [
+            {key: row[key] for key in records[0]}
+            for row in reversed(all_data)
+        ]
+        assert stored == records
 
 
 class TestErrorHandling:
@@ -623,20 +831,20 @@ class TestErrorHandling:
         # For now, we test the error handling structure
         pass
 
-    def test_corrupted_database_handling(self, temp_db_path):
+    def test_corrupted_database_handling(self, temp_db_path, monkeypatch):
         """Test handling of corrupted database files."""
         # Create a corrupted database file
         with open(temp_db_path, 'w') as f:
             f.write('corrupted data')
 
-        with patch('netpulse.database.DB_PATH', Path(temp_db_path)):
-            # This should either raise DatabaseError or succeed
-            # (SQLite can sometimes handle minor corruption gracefully)
-            try:
-                with get_db_connection():
-                    pass  # If it succeeds, that's also acceptable
-            except DatabaseError:
-                pass  # If it raises an error, that's expected
+        monkeypatch.setattr('netpulse.database.DB_PATH', temp_db_path)
+        # This should either raise DatabaseError or succeed
+        # (SQLite can sometimes handle minor corruption gracefully)
+        try:
+            with get_db_connection():
+                pass  # If it succeeds, that's also acceptable
+        except DatabaseError:
+            pass  # If it raises an error, that's expected
 
     def test_sql_injection_prevention(self, initialized_db):
         """Test that SQL injection attempts are prevented by parameterized queries."""
@@ -654,59 +862,64 @@ class TestErrorHandling:
         assert record_id > 0
 
         # Verify the table still exists and has the data
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) as count FROM traffic_data")
-            count = cursor.fetchone()['count']
-            assert count == 1
+        count = initialized_db.execute("SELECT COUNT(*) as count FROM traffic_data").fetchone()['count']
+        assert count == 1
 
-            # Verify the malicious input was stored as literal text
-            cursor.execute("SELECT interface_name FROM traffic_data WHERE id = ?", (record_id,))
-            stored_value = cursor.fetchone()['interface_name']
-            assert stored_value == malicious_input
+        # Verify the malicious input was stored as literal text
+        stored_value = initialized_db.execute(
+            "SELECT interface_name FROM traffic_data WHERE id = ?", (record_id,)
+        ).fetchone()['interface_name']
+        assert stored_value == malicious_input
 
     def test_large_dataset_handling(self, initialized_db):
         """Test handling of large datasets."""
         # Insert a large number of records
         num_records = 1000
 
-        for i in range(num_records):
-            insert_traffic_data(
-                f'2024-01-01T{i % 24:02d}:{i % 60:02d}:00',
-                f'eth{i % 5}',
-                1000 + i,
-                2000 + i,
-                10 + i,
-                20 + i
-            )
-
-        # Test pagination
+        # Build the traffic_data indexes once after loading instead of updating
+        # them row by row; initialize_database recreates them afterwards
+        initialized_db.execute("DROP INDEX idx_traffic_data_timestamp")
+        initialized_db.execute("DROP INDEX idx_traffic_data_interface")
+        try:
+            _bulk_insert(initialized_db, [
+                {
+                    'timestamp': f'2024-01-01T{i % 24:02d}:{i % 60:02d}:00',
+                    'interface_name': f'eth{i % 5}',
+                    'rx_bytes': 1000 + i,
+                    'tx_bytes': 2000 + i,
+                    'rx_packets': 10 + i,
+                    'tx_packets': 20 + i
+                }
+                for i in range(num_records)
+            ])
+        finally:
+            initialize_database()
+
+        # Fetch everything once and check pages against slices of it
+        all_rows = get_traffic_data()
+        assert len(all_rows) == num_records
+
+        # Test pagination at the start, at the end and past the end
         page_size = 100
-        total_pages = (num_records + page_size - 1) // page_size
-
-        for page in range(total_pages):
-            offset = page * page_size
+        for offset in (0, num_records - page_size, num_records):
             data = get_traffic_data(limit=page_size, offset=offset)
-            expected_count = min(page_size, num_records - offset)
-            assert len(data) == expected_count
+            assert data == all_rows[offset:offset + page_size]
 
     def test_memory_usage_with_large_queries(self, initialized_db):
         """Test memory usage with large query results."""
         # Insert many records
-        for i in range(100):
-            insert_traffic_data(
-                f'2024-01-01T12:{i:02d}:00',
-                'eth0',
-                1000 + i,
-                2000 + i,
-                10 + i,
-                20 + i
-            )
+        _bulk_insert(initialized_db, [
+            {
+                'timestamp': f'2024-01-01T12:{i:02d}:00',
+                'interface_name': 'eth0',
+                'rx_bytes': 1000 + i,
+                'tx_bytes': 2000 + i,
+                'rx_packets': 10 + i,
+                'tx_packets': 20 + i
+            }
+            for i in range(100)
+        ])
 
         # This should not cause memory issues
         data = get_traffic_data()
         assert len(data) == 100
-
-        # Test with limit to ensure proper memory management
-        limited_data = get_traffic_data(limit=10)
-        assert len(limited_data) == 10
\ No newline at end of file
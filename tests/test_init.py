@@ -2,8 +2,15 @@
 Tests for package initialization and module structure.
 """
 
+import re
+
 import pytest
 
+import netpulse
+
+# Semantic versioning: x.y.z or x.y.z-alpha.beta
+_SEMVER = re.compile(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?$')
+
 
 class TestPackageStructure:
     """Test the package structure and initialization."""
@@ -18,19 +25,16 @@ class TestPackageStructure:
 
     def test_package_has_version(self):
         """Test that the package has a version attribute."""
-        import netpulse
         assert hasattr(netpulse, '__version__')
         assert netpulse.__version__ == "0.1.0"
 
     def test_package_has_author(self):
         """Test that the package has an author attribute."""
-        import netpulse
         assert hasattr(netpulse, '__author__')
         assert netpulse.__author__ == "Vikrant with help from roo/code-supernova"
 
     def test_package_has_description(self):
         """Test that the package has a description attribute."""
-        import netpulse
         assert hasattr(netpulse, '__description__')
         assert "Lightweight network traffic monitoring" in netpulse.__description__
 
@@ -48,25 +52,16 @@ class TestPackageMetadata:
 
     def test_version_format(self):
         """Test that version follows semantic versioning."""
-        import netpulse
-        import re
-
-        version = netpulse.__version__
-        # Should match semantic versioning pattern (x.y.z or x.y.z-alpha.beta)
-        assert re.match(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?$', version)
+        assert _SEMVER.match(netpulse.__version__)
 
     def test_package_attributes_are_strings(self):
         """Test that package attributes are strings."""
-        import netpulse
-
         assert isinstance(netpulse.__version__, str)
         assert isinstance(netpulse.__author__, str)
         assert isinstance(netpulse.__description__, str)
 
     def test_package_attributes_not_empty(self):
         """Test that package attributes are not empty."""
-        import netpulse
-
         assert len(netpulse.__version__) > 0
         assert len(netpulse.__author__) > 0
         assert len(netpulse.__description__) > 0
@@ -95,14 +90,12 @@ class TestPackageDocstring:
 
     def test_package_has_docstring(self):
         """Test that the package has a docstring."""
-        import netpulse
         assert hasattr(netpulse, '__doc__')
         assert netpulse.__doc__ is not None
         assert len(netpulse.__doc__) > 0
 
     def test_docstring_content(self):
         """Test that the docstring contains expected content."""
-        import netpulse
         docstring = netpulse.__doc__
 
         assert "Net-Pulse" in docstring
@@ -22,16 +22,20 @@ from netpulse.network import (
     NetworkError,
     InterfaceNotFoundError,
     PermissionError,
+    clear_interface_cache,
     get_network_interfaces,
     get_interface_stats,
     get_all_interface_stats,
     validate_interface,
+    validate_interfaces,
     get_primary_interface,
     get_interface_traffic_summary
 )
 
 
-@pytest.fixture
+# The psutil fixtures are only read by the tests, so their mocks are built
+# once per module rather than once per test
+@pytest.fixture(scope="module")
 def mock_psutil_net_if_addrs():
     """Mock psutil.net_if_addrs() with sample interface data."""
     # Import psutil constants to avoid type checker issues
@@ -58,7 +62,7 @@ def mock_psutil_net_if_addrs():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_psutil_net_if_stats():
     """Mock psutil.net_if_stats() with sample interface status data."""
     return {
@@ -68,7 +72,7 @@ def mock_psutil_net_if_stats():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_psutil_net_io_counters():
     """Mock psutil.net_io_counters() with sample traffic statistics."""
     return {
@@ -300,6 +304,43 @@ class TestGetNetworkInterfaces:
             with pytest.raises(NetworkError, match="Failed to discover network interfaces"):
                 get_network_interfaces()
 
+    def test_get_network_interfaces_reuses_recent_result(self, mock_psutil_net_if_addrs, mock_psutil_net_if_stats):
+        """Test that calls within the cache TTL share one enumeration."""
+        with patch('psutil.net_if_addrs', return_value=mock_psutil_net_if_addrs) as mock_addrs, \
+             patch('psutil.net_if_stats', return_value=mock_psutil_net_if_stats):
+
+            first = get_network_interfaces()
+            second = get_network_interfaces()
+
+            assert mock_addrs.call_count == 1
+            assert second == first
+            assert second is not first
+
+            clear_interface_cache()
+            get_network_interfaces()
+            assert mock_addrs.call_count == 2
+
+    def test_get_network_interfaces_cache_expires(self, mock_psutil_net_if_addrs, mock_psutil_net_if_stats):
+        """Test that interfaces are enumerated again once the cache TTL has passed."""
+        with patch('psutil.net_if_addrs', return_value=mock_psutil_net_if_addrs) as mock_addrs, \
+             patch('psutil.net_if_stats', return_value=mock_psutil_net_if_stats), \
+             patch('netpulse.network.time.monotonic', side_effect=[100.0, 103.0, 103.0]):
+
+            get_network_interfaces()
+            get_network_interfaces()
+
+            assert mock_addrs.call_count == 2
+
+    def test_get_network_interfaces_failure_not_cached(self, mock_psutil_net_if_addrs, mock_psutil_net_if_stats):
+        """Test that a failed enumeration is retried on the next call."""
+        with patch('psutil.net_if_addrs', side_effect=[Exception("General error"), mock_psutil_net_if_addrs]), \
+             patch('psutil.net_if_stats', return_value=mock_psutil_net_if_stats):
+
+            with pytest.raises(NetworkError):
+                get_network_interfaces()
+
+            assert len(get_network_interfaces()) == 3
+
 
 class TestGetInterfaceStats:
     """Test get_interface_stats() function."""
@@ -607,6 +648,42 @@ class TestValidateInterface:
             assert result is False
 
 
+class TestValidateInterfaces:
+    """Test validate_interfaces() function."""
+
+    def test_validate_interfaces_filters_in_order(self, mock_psutil_net_if_addrs, mock_psutil_net_if_stats):
+        """Test validate_interfaces() keeps only existing, active interfaces in input order."""
+        with patch('psutil.net_if_addrs', return_value=mock_psutil_net_if_addrs) as mock_addrs, \
+             patch('psutil.net_if_stats', return_value=mock_psutil_net_if_stats) as mock_stats:
+
+            result = validate_interfaces(['lo', 'nonexistent', 'wlan0', 'eth0'])
+
+            assert result == ['lo', 'eth0']
+            mock_addrs.assert_called_once()
+            mock_stats.assert_called_once()
+
+    def test_validate_interfaces_matches_validate_interface(self, mock_psutil_net_if_addrs, mock_psutil_net_if_stats):
+        """Test validate_interfaces() agrees with validate_interface() for each name."""
+        names = ['eth0', 'wlan0', 'lo', 'nonexistent']
+        with patch('psutil.net_if_addrs', return_value=mock_psutil_net_if_addrs), \
+             patch('psutil.net_if_stats', return_value=mock_psutil_net_if_stats):
+
+            expected = [name for name in names if validate_interface(name)]
+            assert validate_interfaces(names) == expected
+
+    def test_validate_interfaces_status_check_failure(self, mock_psutil_net_if_addrs):
+        """Test validate_interfaces() falls back to addresses when status check fails."""
+        with patch('psutil.net_if_addrs', return_value=mock_psutil_net_if_addrs), \
+             patch('psutil.net_if_stats', side_effect=Exception("Status check failed")):
+
+            assert validate_interfaces(['eth0', 'nonexistent']) == ['eth0']
+
+    def test_validate_interfaces_general_exception(self):
+        """Test validate_interfaces() with general exception."""
+        with patch('psutil.net_if_addrs', side_effect=Exception("General error")):
+            assert validate_interfaces(['eth0']) == []
+
+
 class TestGetPrimaryInterface:
     """Test get_primary_interface() function."""
 
@@ -4,6 +4,8 @@ Test utilities and helper functions for Net-Pulse tests.
 
 import json
 import time
+from contextlib import contextmanager
+from datetime import timedelta
 from typing import Any, Dict, Optional
 from unittest.mock import Mock
 
@@ -163,4 +165,38 @@ def assert_valid_timestamp(timestamp: str):
     """Assert that timestamp is in valid ISO format."""
     import re
     iso_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$'
-    assert re.match(iso_pattern, timestamp), f"Invalid timestamp format: {timestamp}"
\ No newline at end of file
+    assert re.match(iso_pattern, timestamp), f"Invalid timestamp format: {timestamp}"
+
+
+# Collector test helpers
+@contextmanager
+def temporary_collector(**kwargs):
+    """Context manager for creating and cleaning up a NetworkDataCollector instance."""
+    from netpulse.collector import NetworkDataCollector
+    collector = NetworkDataCollector(**kwargs)
+    try:
+        yield collector
+    finally:
+        if collector._is_running:
+            collector.stop_collection()
+
+
+def assert_collection_stats_equal(stats1, stats2):
+    """Helper to compare CollectionStats objects (counters only, not timestamps)."""
+    assert (
+        stats1.total_polls, stats1.successful_polls, stats1.failed_polls,
+        stats1.interfaces_monitored, stats1.total_errors, stats1.consecutive_failures
+    ) == (
+        stats2.total_polls, stats2.successful_polls, stats2.failed_polls,
+        stats2.interfaces_monitored, stats2.total_errors, stats2.consecutive_failures
+    )
+
+
+def assert_interface_data_equal(data1, data2):
+    """Helper to compare InterfaceData objects."""
+    assert data1 == data2
+
+
+def advance_time(mock_time_module, seconds):
+    """Helper to advance mocked time for testing."""
+    mock_time_module['time_counter']['current'] += timedelta(seconds=seconds)
\ No newline at end of file